@@ -43,15 +43,18 @@ def scan_frontend(project_path: str, output_dir: str = "./scanner_output") -> di
     
     # Create and run workflow
     workflow = create_scanner_workflow(config)
-    
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
-        console=console
+        console=console,
+        transient=True,
+        refresh_per_second=4,
+        disable=not sys.stdout.isatty()
     ) as progress:
-        task = progress.add_task("Scanning files...", total=None)
-        
+        progress.add_task("Scanning files...", total=None)
+
         result = workflow.invoke({
             "config": config,
             "file_inventory": None,
@@ -63,8 +66,6 @@ def scan_frontend(project_path: str, output_dir: str = "./scanner_output") -> di
             "vector_index": None,
             "logs": []
         })
-        
-        progress.update(task, completed=100)
     
     # Load manifest
     manifest_path = Path(output_dir) / "manifest.json"
@@ -112,9 +113,12 @@ def generate_backend(manifest: dict, requirements: str, output_dir: str = "./gen
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=console,
+            transient=True,
+            refresh_per_second=4,
+            disable=not sys.stdout.isatty()
         ) as progress:
-            task = progress.add_task("Generating backend...", total=None)
+            progress.add_task("Generating backend...", total=None)
             
             # Initial state
             initial_state = {
@@ -151,7 +155,6 @@ def generate_backend(manifest: dict, requirements: str, output_dir: str = "./gen
             }
             
             result = workflow.invoke(initial_state)
-            progress.update(task, completed=100)
         
         console.print(f"[green]✓[/green] Backend generation complete!")
         console.print(f"  → Language: {result.get('selected_stack', {}).get('language', 'N/A')}")
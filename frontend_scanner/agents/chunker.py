@@ -1,11 +1,68 @@
 """Chunker Agent - AST-aware code chunking."""
+import dataclasses
+import functools
 from typing import List, Dict, Any
-from pydantic import BaseModel, Field
+import numpy as np
 import tiktoken
 
 
-class CodeChunk(BaseModel):
-    """Represents a chunk of code with metadata."""
+from frontend_scanner.utils.jit import maybe_njit
+
+
+@maybe_njit
+def _compute_chunk_boundaries(line_tokens, chunk_size, overlap):
+    """Scan per-line token counts and return chunk boundary arrays.
+
+    Pure integer arithmetic over an int32 array: returns parallel arrays
+    (starts, ends, token_sums) where each triple describes a chunk covering
+    lines[start:end]. Overlap is taken as the longest line suffix of the
+    emitted chunk whose token total fits the overlap budget.
+    """
+    n = line_tokens.shape[0]
+    starts = np.empty(n + 1, np.int32)
+    ends = np.empty(n + 1, np.int32)
+    sums = np.empty(n + 1, np.int64)
+    count = 0
+
+    chunk_start = 0
+    current = 0
+
+    for i in range(n):
+        t = line_tokens[i]
+        if current + t > chunk_size and i > chunk_start:
+            starts[count] = chunk_start
+            ends[count] = i
+            sums[count] = current
+            count += 1
+
+            # Walk back from the boundary to find the overlap suffix
+            s = i
+            overlap_tokens = 0
+            while s > chunk_start and overlap_tokens + line_tokens[s - 1] <= overlap:
+                overlap_tokens += line_tokens[s - 1]
+                s -= 1
+            chunk_start = s
+            current = overlap_tokens + t
+        else:
+            current += t
+
+    if chunk_start < n:
+        starts[count] = chunk_start
+        ends[count] = n
+        sums[count] = current
+        count += 1
+
+    return starts[:count], ends[:count], sums[:count]
+
+
+@dataclasses.dataclass(slots=True)
+class CodeChunk:
+    """Represents a chunk of code with metadata.
+
+    A plain slotted dataclass rather than a pydantic model: chunks are
+    internal, constructed one-per-chunk in hot loops, and never cross a
+    trust boundary before export.
+    """
     chunk_id: str
     file_path: str
     content: str
@@ -14,13 +71,32 @@ class CodeChunk(BaseModel):
     token_count: int
     chunk_type: str
     language: str
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-    provenance: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    provenance: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for export."""
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass(slots=True)
+class FileView:
+    """Array-backed view of one source file, built once per file.
+
+    Every chunking strategy shares the same splitlines result and
+    per-line token counts instead of re-deriving them.
+    """
+    text: str
+    lines: List[str]
+    line_token_counts: np.ndarray  # int32 approximate (len//4) tokens per line
 
 
 class ChunkerAgent:
     """Agent that chunks code using AST-aware strategies."""
-    
+
+    # Lines longer than this bypass the token-count cache to bound memory
+    MAX_CACHED_LINE_LENGTH = 200
+
     def __init__(self, config):
         self.config = config
         try:
@@ -28,9 +104,21 @@ class ChunkerAgent:
         except Exception as e:
             print(f"Warning: Could not load tiktoken encoding: {e}")
             self.encoding = None
-    
+
+        # Frontend files repeat many short lines (imports, braces, blanks),
+        # so cache per-line counts instead of re-encoding each occurrence.
+        self._count_tokens_cached = functools.lru_cache(maxsize=65536)(
+            self._count_tokens_uncached
+        )
+
     def count_tokens(self, text: str) -> int:
         """Count tokens in text."""
+        if len(text) <= self.MAX_CACHED_LINE_LENGTH:
+            return self._count_tokens_cached(text)
+        return self._count_tokens_uncached(text)
+
+    def _count_tokens_uncached(self, text: str) -> int:
+        """Count tokens without consulting the cache."""
         if self.encoding:
             try:
                 return len(self.encoding.encode(text))
@@ -39,59 +127,77 @@ class ChunkerAgent:
         # Fallback: approximate tokens
         return len(text) // 4
     
-    def chunk(self, parsed_file, file_content: str) -> List[CodeChunk]:
-        """Create chunks from parsed file."""
+    def build_file_view(self, text: str) -> FileView:
+        """Build the shared per-file view (single splitlines + token pass)."""
+        lines = text.splitlines()
+        return FileView(
+            text=text,
+            lines=lines,
+            line_token_counts=self._line_token_counts(lines),
+        )
+
+    def chunk(self, parsed_file, file_content) -> List[CodeChunk]:
+        """Create chunks from parsed file.
+
+        ``file_content`` may be the raw text or an already-built FileView.
+        """
         chunks = []
-        
-        if not file_content.strip():
+
+        view = (file_content if isinstance(file_content, FileView)
+                else self.build_file_view(file_content))
+
+        if not view.text.strip():
             return chunks
-        
+
         try:
             if self.config.chunking.use_ast_chunking and parsed_file.components:
-                chunks.extend(self._chunk_by_components(parsed_file, file_content))
-            else:
-                chunks.extend(self._chunk_by_tokens(parsed_file, file_content))
+                chunks.extend(self._chunk_by_components(parsed_file, view))
+            if not chunks:
+                # No components, or none covered any content (e.g. all
+                # collapsed onto one line) — fall back to token chunking.
+                chunks.extend(self._chunk_by_tokens(parsed_file, view))
         except Exception as e:
             print(f"Error chunking {parsed_file.file_path}: {e}")
             # Fallback to simple chunking
-            chunks.extend(self._chunk_by_lines(parsed_file, file_content))
-        
+            chunks.extend(self._chunk_by_lines(parsed_file, view))
+
         return chunks
-    
-    def _chunk_by_components(self, parsed_file, content: str) -> List[CodeChunk]:
+
+    def _chunk_by_components(self, parsed_file, view: FileView) -> List[CodeChunk]:
         """Chunk code by AST components."""
         chunks = []
-        lines = content.splitlines()
-        
+        lines = view.lines
+
         if not lines:
             return chunks
-        
+
         if not hasattr(parsed_file, 'components') or not parsed_file.components:
-            return self._chunk_by_tokens(parsed_file, content)
-        
+            return self._chunk_by_tokens(parsed_file, view)
+
         for i, component in enumerate(parsed_file.components):
             try:
                 if not hasattr(component, 'start_line') or not hasattr(component, 'end_line'):
                     continue
-                
+
                 start_line = max(0, component.start_line)
                 end_line = min(len(lines), component.end_line + 1)
-                
+
                 if start_line >= end_line:
                     continue
-                
+
                 chunk_content = "\n".join(lines[start_line:end_line])
-                
+
                 if not chunk_content.strip():
                     continue
-                
-                token_count = self.count_tokens(chunk_content)
-                
-                if token_count > self.config.chunking.chunk_size:
+
+                approx_tokens = int(view.line_token_counts[start_line:end_line].sum())
+
+                if approx_tokens > self.config.chunking.chunk_size:
                     chunks.extend(self._split_large_chunk(
-                        chunk_content,
+                        view,
                         parsed_file.file_path,
                         start_line,
+                        end_line,
                         component,
                         parsed_file.language
                     ))
@@ -102,7 +208,7 @@ class ChunkerAgent:
                         content=chunk_content,
                         start_line=start_line,
                         end_line=end_line,
-                        token_count=token_count,
+                        token_count=self.count_tokens(chunk_content),
                         chunk_type="component",
                         language=parsed_file.language,
                         metadata={
@@ -124,84 +230,68 @@ class ChunkerAgent:
         
         return chunks
     
-    def _chunk_by_tokens(self, parsed_file, content: str) -> List[CodeChunk]:
+    def _line_token_counts(self, lines: List[str]) -> np.ndarray:
+        """Approximate tokens per line into an int32 array.
+
+        Boundary-seeking only needs bucketing accuracy, so the free
+        len//4 heuristic is used here; emitted chunks get stamped with an
+        exact count once, via count_tokens on the joined content.
+        """
+        return np.fromiter((len(line) >> 2 for line in lines),
+                           dtype=np.int32, count=len(lines))
+
+    def _chunk_by_tokens(self, parsed_file, view: FileView) -> List[CodeChunk]:
         """Token-based chunking with overlap."""
         chunks = []
-        lines = content.splitlines()
-        
+        lines = view.lines
+
         if not lines:
             return chunks
-        
+
         chunk_size = self.config.chunking.chunk_size
         overlap = self.config.chunking.chunk_overlap
-        
-        current_chunk = []
-        current_tokens = 0
-        chunk_start_line = 0
+
+        starts, ends, _ = _compute_chunk_boundaries(
+            view.line_token_counts, chunk_size, overlap
+        )
+
         chunk_idx = 0
-        
-        for i, line in enumerate(lines):
-            line_tokens = self.count_tokens(line)
-            
-            if current_tokens + line_tokens > chunk_size and current_chunk:
-                chunk_content = "\n".join(current_chunk)
-                
-                if chunk_content.strip():
-                    chunks.append(CodeChunk(
-                        chunk_id=f"{parsed_file.file_path}:token:{chunk_idx}",
-                        file_path=parsed_file.file_path,
-                        content=chunk_content,
-                        start_line=chunk_start_line,
-                        end_line=i,
-                        token_count=current_tokens,
-                        chunk_type="text",
-                        language=parsed_file.language,
-                        metadata={"framework": parsed_file.framework},
-                        provenance={
-                            "file": parsed_file.file_path,
-                            "lines": f"{chunk_start_line}-{i}",
-                        }
-                    ))
-                
-                overlap_lines = self._get_overlap_lines(current_chunk, overlap)
-                current_chunk = overlap_lines + [line]
-                current_tokens = self.count_tokens("\n".join(current_chunk))
-                chunk_start_line = i - len(overlap_lines)
-                chunk_idx += 1
-            else:
-                current_chunk.append(line)
-                current_tokens += line_tokens
-        
-        if current_chunk and "\n".join(current_chunk).strip():
+        for start, end in zip(starts, ends):
+            chunk_content = "\n".join(lines[start:end])
+
+            if not chunk_content.strip():
+                continue
+
             chunks.append(CodeChunk(
                 chunk_id=f"{parsed_file.file_path}:token:{chunk_idx}",
                 file_path=parsed_file.file_path,
-                content="\n".join(current_chunk),
-                start_line=chunk_start_line,
-                end_line=len(lines),
-                token_count=current_tokens,
+                content=chunk_content,
+                start_line=int(start),
+                end_line=int(end),
+                token_count=self.count_tokens(chunk_content),
                 chunk_type="text",
                 language=parsed_file.language,
                 metadata={"framework": parsed_file.framework},
                 provenance={
                     "file": parsed_file.file_path,
-                    "lines": f"{chunk_start_line}-{len(lines)}",
+                    "lines": f"{start}-{end}",
                 }
             ))
-        
+            chunk_idx += 1
+
         return chunks
     
-    def _chunk_by_lines(self, parsed_file, content: str) -> List[CodeChunk]:
+    def _chunk_by_lines(self, parsed_file, view: FileView) -> List[CodeChunk]:
         """Simple line-based chunking fallback."""
         chunks = []
-        lines = content.splitlines()
-        
+        lines = view.lines
+
         lines_per_chunk = 50
-        
+
         for i in range(0, len(lines), lines_per_chunk):
             chunk_lines = lines[i:i + lines_per_chunk]
             chunk_content = "\n".join(chunk_lines)
-            
+
             if chunk_content.strip():
                 chunks.append(CodeChunk(
                     chunk_id=f"{parsed_file.file_path}:lines:{i}",
@@ -209,7 +299,7 @@ class ChunkerAgent:
                     content=chunk_content,
                     start_line=i,
                     end_line=i + len(chunk_lines),
-                    token_count=self.count_tokens(chunk_content),
+                    token_count=len(chunk_content) >> 2,
                     chunk_type="text",
                     language=parsed_file.language,
                     metadata={},
@@ -221,74 +311,37 @@ class ChunkerAgent:
         
         return chunks
     
-    def _split_large_chunk(self, content: str, file_path: str,
-                          start_line: int, component, language: str) -> List[CodeChunk]:
+    def _split_large_chunk(self, view: FileView, file_path: str,
+                          start_line: int, end_line: int,
+                          component, language: str) -> List[CodeChunk]:
         """Split a large component into smaller chunks."""
         chunks = []
-        lines = content.splitlines()
+        lines = view.lines[start_line:end_line]
         chunk_size = self.config.chunking.chunk_size
-        
-        current_chunk = []
-        current_tokens = 0
-        chunk_start = 0
-        
-        for i, line in enumerate(lines):
-            line_tokens = self.count_tokens(line)
-            
-            if current_tokens + line_tokens > chunk_size and current_chunk:
-                chunk_content = "\n".join(current_chunk)
-                if chunk_content.strip():
-                    chunks.append(CodeChunk(
-                        chunk_id=f"{file_path}:component-split:{len(chunks)}",
-                        file_path=file_path,
-                        content=chunk_content,
-                        start_line=start_line + chunk_start,
-                        end_line=start_line + i,
-                        token_count=current_tokens,
-                        chunk_type="component",
-                        language=language,
-                        metadata={"component_name": getattr(component, 'name', 'unknown'), "split": True},
-                        provenance={
-                            "file": file_path,
-                            "lines": f"{start_line + chunk_start}-{start_line + i}",
-                        }
-                    ))
-                current_chunk = [line]
-                current_tokens = line_tokens
-                chunk_start = i
-            else:
-                current_chunk.append(line)
-                current_tokens += line_tokens
-        
-        if current_chunk and "\n".join(current_chunk).strip():
+
+        starts, ends, _ = _compute_chunk_boundaries(
+            view.line_token_counts[start_line:end_line], chunk_size, 0
+        )
+
+        for start, end in zip(starts, ends):
+            chunk_content = "\n".join(lines[start:end])
+            if not chunk_content.strip():
+                continue
+
             chunks.append(CodeChunk(
                 chunk_id=f"{file_path}:component-split:{len(chunks)}",
                 file_path=file_path,
-                content="\n".join(current_chunk),
-                start_line=start_line + chunk_start,
-                end_line=start_line + len(lines),
-                token_count=current_tokens,
+                content=chunk_content,
+                start_line=start_line + int(start),
+                end_line=start_line + int(end),
+                token_count=self.count_tokens(chunk_content),
                 chunk_type="component",
                 language=language,
                 metadata={"component_name": getattr(component, 'name', 'unknown'), "split": True},
                 provenance={
                     "file": file_path,
-                    "lines": f"{start_line + chunk_start}-{start_line + len(lines)}",
+                    "lines": f"{start_line + int(start)}-{start_line + int(end)}",
                 }
             ))
-        
+
         return chunks
-    
-    def _get_overlap_lines(self, lines: List[str], overlap_tokens: int) -> List[str]:
-        """Get lines for overlap based on token count."""
-        overlap_lines = []
-        tokens = 0
-        
-        for line in reversed(lines):
-            line_tokens = self.count_tokens(line)
-            if tokens + line_tokens > overlap_tokens:
-                break
-            overlap_lines.insert(0, line)
-            tokens += line_tokens
-        
-        return overlap_lines
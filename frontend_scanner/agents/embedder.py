@@ -1,29 +1,43 @@
 """Embedder Agent - Generate vector embeddings for code chunks."""
-from typing import List, Any
-from pydantic import BaseModel
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional
 import os
 
-try:
-    from langchain_openai import OpenAIEmbeddings
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    print("Warning: OpenAI embeddings not available")
+import numpy as np
+
+# langchain_openai and langchain_community (which drags in transformers/
+# torch for local embeddings) are imported lazily in _init_embedder so
+# scan-only runs never pay their multi-second import cost.
 
 try:
-    from langchain_community.embeddings import HuggingFaceEmbeddings
-    HUGGINGFACE_AVAILABLE = True
+    import httpx
+    HTTPX_AVAILABLE = True
 except ImportError:
-    HUGGINGFACE_AVAILABLE = False
-    print("Warning: HuggingFace embeddings not available")
+    HTTPX_AVAILABLE = False
 
 
-class ChunkEmbedding(BaseModel):
-    """Embedding result for a chunk."""
+@dataclasses.dataclass(slots=True)
+class ChunkEmbedding:
+    """Embedding result for a chunk.
+
+    Slotted dataclass: one instance per chunk, internal-only (see CodeChunk).
+    The vector is a contiguous float32 numpy row (a view into the batch
+    array), not a list of boxed Python floats: ~7x less memory and
+    SIMD-friendly for downstream similarity math.
+    """
     chunk_id: str
-    embedding: List[float]
+    embedding: np.ndarray
     model: str
 
+    def to_dict(self) -> dict:
+        """Serialize for export."""
+        return {
+            "chunk_id": self.chunk_id,
+            "embedding": self.embedding.tolist(),
+            "model": self.model,
+        }
+
 
 class EmbedderAgent:
     """Agent that generates embeddings for code chunks."""
@@ -31,72 +45,191 @@ class EmbedderAgent:
     def __init__(self, config):
         self.config = config
         self.embedder = None
+        self._http_client = None
         self._init_embedder()
-    
+
+    def _build_http_client(self):
+        """Build one pooled httpx client shared across all embed batches.
+
+        Keep-alive pooling avoids per-batch TLS/connection warmup; HTTP/2
+        multiplexing is enabled when the optional h2 package is installed.
+        """
+        if not HTTPX_AVAILABLE:
+            return None
+
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        return httpx.Client(
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=60
+        )
+
     def _init_embedder(self):
-        """Initialize embedding model."""
+        """Initialize embedding model (provider imported on first use)."""
         try:
-            if self.config.embedding.provider == "openai" and OPENAI_AVAILABLE:
+            if self.config.embedding.provider == "openai":
+                try:
+                    from langchain_openai import OpenAIEmbeddings
+                except ImportError:
+                    print("Error: OpenAI embeddings not available")
+                    print("Install: pip install langchain-openai")
+                    return
+
                 api_key = os.getenv("OPENAI_API_KEY")
                 if not api_key:
                     print("Warning: OPENAI_API_KEY not set. Embeddings will fail.")
-                
+
+                client_kwargs = {}
+                self._http_client = self._build_http_client()
+                if self._http_client is not None:
+                    client_kwargs["http_client"] = self._http_client
+
                 self.embedder = OpenAIEmbeddings(
                     model=self.config.embedding.model,
-                    dimensions=self.config.embedding.dimensions
+                    dimensions=self.config.embedding.dimensions,
+                    **client_kwargs
                 )
                 print(f"✓ Initialized OpenAI embeddings: {self.config.embedding.model}")
-            
-            elif self.config.embedding.provider == "local" and HUGGINGFACE_AVAILABLE:
+
+            elif self.config.embedding.provider == "local":
+                try:
+                    from langchain_community.embeddings import HuggingFaceEmbeddings
+                except ImportError:
+                    print("Error: HuggingFace embeddings not available")
+                    print("Install: pip install langchain-community sentence-transformers")
+                    return
+
                 self.embedder = HuggingFaceEmbeddings(
                     model_name=self.config.embedding.model
                 )
                 print(f"✓ Initialized local HuggingFace embeddings: {self.config.embedding.model}")
-            
+
             else:
                 print("Error: No embedding provider available")
                 print("Install: pip install langchain-openai")
-        
+
         except Exception as e:
             print(f"Error initializing embedder: {e}")
             self.embedder = None
     
-    def embed_chunks(self, chunks: List[Any]) -> List[ChunkEmbedding]:
-        """Generate embeddings for all chunks."""
+    def _embed_batch(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Embed one batch of texts, returning a float32 array (or None)."""
+        try:
+            batch_embeddings = self.embedder.embed_documents(texts)
+            # One contiguous float32 array per batch; rows are views
+            return np.asarray(batch_embeddings, dtype=np.float32)
+        except Exception as e:
+            print(f"Error embedding batch of {len(texts)}: {e}")
+            return None
+
+    def embed_chunks(self, chunks: List[Any],
+                     cache=None) -> List[ChunkEmbedding]:
+        """Generate embeddings for all chunks.
+
+        ``cache`` (a ScanCache) serves vectors for content seen on earlier
+        scans, so only genuinely new chunks reach the provider.
+        """
         if not chunks:
             print("No chunks provided for embedding")
             return []
-        
+
         if not self.embedder:
             print("Warning: No embedder available. Returning empty embeddings.")
             return []
         
-        embeddings = []
         batch_size = self.config.embedding.batch_size
-        
-        print(f"Generating embeddings for {len(chunks)} chunks...")
-        
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i:i + batch_size]
-            texts = [getattr(chunk, 'content', '') for chunk in batch if chunk]
-            
-            try:
-                batch_embeddings = self.embedder.embed_documents(texts)
-                
-                for chunk, embedding in zip(batch, batch_embeddings):
-                    embeddings.append(ChunkEmbedding(
-                        chunk_id=chunk.chunk_id,
-                        embedding=embedding,
-                        model=self.config.embedding.model
-                    ))
-                
-                if (i // batch_size + 1) % 5 == 0:
-                    print(f"  Processed {i + len(batch)}/{len(chunks)} chunks")
-            
-            except Exception as e:
-                print(f"Error embedding batch {i // batch_size}: {e}")
-                # Continue with next batch
-                continue
-        
+
+        # Embedding is a pure function of content, so duplicate chunks
+        # (barrel files, license headers, generated re-exports) only need
+        # one API call each; results are scattered back to every copy.
+        unique_texts = []
+        text_to_index = {}
+        chunk_indices = []
+        for chunk in chunks:
+            text = getattr(chunk, 'content', '') if chunk else ''
+            index = text_to_index.get(text)
+            if index is None:
+                index = len(unique_texts)
+                text_to_index[text] = index
+                unique_texts.append(text)
+            chunk_indices.append(index)
+
+        duplicates = len(chunks) - len(unique_texts)
+        print(f"Generating embeddings for {len(chunks)} chunks"
+              + (f" ({duplicates} duplicates reuse a unique embedding)" if duplicates else "")
+              + "...")
+
+        unique_vectors = [None] * len(unique_texts)
+
+        # Serve persisted vectors first; only misses get embedded
+        miss_indices = list(range(len(unique_texts)))
+        hashes = None
+        if cache is not None:
+            hashes = [cache.content_hash(text) for text in unique_texts]
+            found = cache.get_embeddings(
+                hashes,
+                model=self.config.embedding.model,
+                dims=self.config.embedding.dimensions
+            )
+            miss_indices = []
+            for i, key in enumerate(hashes):
+                vector = found.get(key)
+                if vector is not None:
+                    unique_vectors[i] = vector
+                else:
+                    miss_indices.append(i)
+            if len(found):
+                print(f"  {len(found)} embeddings served from cache")
+
+        miss_texts = [unique_texts[i] for i in miss_indices]
+        batches = [
+            miss_texts[i:i + batch_size]
+            for i in range(0, len(miss_texts), batch_size)
+        ]
+
+        # Remote embedding calls are network-bound, so several batches fly
+        # concurrently; workers defaults to the core count.
+        workers = self.config.embedding.workers or os.cpu_count() or 1
+
+        if len(batches) > 1 and workers > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as pool:
+                batch_arrays = list(pool.map(self._embed_batch, batches))
+        else:
+            batch_arrays = [self._embed_batch(batch) for batch in batches]
+
+        offset = 0
+        for batch, batch_array in zip(batches, batch_arrays):
+            if batch_array is not None:
+                for j, embedding in enumerate(batch_array):
+                    unique_vectors[miss_indices[offset + j]] = embedding
+            offset += len(batch)
+
+        if cache is not None:
+            cache.put_embeddings(
+                {
+                    hashes[i]: unique_vectors[i]
+                    for i in miss_indices
+                    if unique_vectors[i] is not None
+                },
+                model=self.config.embedding.model,
+                dims=self.config.embedding.dimensions
+            )
+
+        embeddings = []
+        for chunk, index in zip(chunks, chunk_indices):
+            vector = unique_vectors[index]
+            if vector is None:
+                continue  # Batch failed; skip chunks that map into it
+            embeddings.append(ChunkEmbedding(
+                chunk_id=chunk.chunk_id,
+                embedding=vector,
+                model=self.config.embedding.model
+            ))
+
         print(f"✓ Generated {len(embeddings)} embeddings")
         return embeddings
@@ -1,93 +1,198 @@
 """Exporter Agent - Export all results."""
 import json
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 
 class ExporterAgent:
     """Agent that exports scan results to filesystem."""
-    
+
+    FILE_CACHE_NAME = "file_cache.json"
+
     def __init__(self, config):
         self.config = config
         self.output_dir = Path(config.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-    
+        self.cache_dir = Path(getattr(config, 'scan_cache_dir', self.output_dir))
+
+    def load_file_cache(self) -> Dict[str, Any]:
+        """Load the incremental-scan cache from a previous run."""
+        cache_path = self.cache_dir / self.FILE_CACHE_NAME
+        if not cache_path.exists():
+            return {}
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Warning: Could not load file cache: {e}")
+            return {}
+
+    def export_file_cache(self, file_cache: Dict[str, Any]):
+        """Persist the incremental-scan cache for the next run."""
+        if not file_cache:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path = self.cache_dir / self.FILE_CACHE_NAME
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(file_cache, f)
+            print(f"  ✓ {self.FILE_CACHE_NAME}")
+        except Exception as e:
+            print(f"  ✗ Error exporting file cache: {e}")
+
     def export(self, manifest: Any, summaries: Dict[str, Any],
-               vector_index: Dict[str, Any], file_inventory: Any):
+               vector_index: Dict[str, Any], file_inventory: Any,
+               file_cache: Dict[str, Any] = None):
         """Export all results."""
         print("\nExporting results...")
-        
+
         try:
-            self._export_manifest(manifest)
-            self._export_summaries(summaries)
-            self._export_inventory(file_inventory)
-            self._export_logs(vector_index)
-            
+            # Serialize everything first, then write each file with a single
+            # syscall and defer fsync to one batch at the end so the kernel
+            # can overlap writeback across the four files.
+            payloads = [
+                ("manifest.json", self._manifest_payload(manifest)),
+                ("hierarchical_summaries.json", self._summaries_payload(summaries)),
+                ("file_inventory.json", self._inventory_payload(file_inventory)),
+                ("scan_logs.json", self._logs_payload(vector_index)),
+            ]
+
+            self._write_payloads(payloads)
+
+            if file_cache:
+                self.export_file_cache(file_cache)
+
             print(f"\n✅ All results exported to: {self.output_dir}")
-        
+
         except Exception as e:
             print(f"Error exporting results: {e}")
-    
-    def _export_manifest(self, manifest):
-        """Export manifest.json."""
-        try:
-            output_path = self.output_dir / "manifest.json"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(manifest.model_dump(), f, indent=2)
-            print(f"  ✓ manifest.json")
-        except Exception as e:
-            print(f"  ✗ Error exporting manifest: {e}")
-    
-    def _export_summaries(self, summaries: Dict[str, Any]):
-        """Export hierarchical_summaries.json."""
+
+    def _write_payloads(self, payloads: List[Tuple[str, Any]]):
+        """Write serialized payloads, batching fsync after all writes.
+
+        Payloads may be pre-serialized bytes (pydantic's Rust serializer)
+        or plain objects to run through json.dumps.
+        """
+        open_fds = []
+
         try:
-            output_path = self.output_dir / "hierarchical_summaries.json"
-            
-            export_data = {
-                "file_summaries": [
-                    s.model_dump() if hasattr(s, 'model_dump') else dict(s) 
-                    for s in summaries.get("file_summaries", [])
-                ],
-                "folder_summaries": [
-                    s.model_dump() if hasattr(s, 'model_dump') else dict(s)
-                    for s in summaries.get("folder_summaries", [])
-                ],
-                "project_summary": (
-                    summaries.get("project_summary").model_dump()
-                    if summaries.get("project_summary") and hasattr(summaries.get("project_summary"), 'model_dump')
-                    else {}
-                )
-            }
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2)
-            print(f"  ✓ hierarchical_summaries.json")
-        except Exception as e:
-            print(f"  ✗ Error exporting summaries: {e}")
-    
-    def _export_inventory(self, inventory):
-        """Export file_inventory.json."""
+            for filename, payload in payloads:
+                if payload is None:
+                    continue
+
+                try:
+                    fd = os.open(
+                        str(self.output_dir / filename),
+                        os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                        0o644
+                    )
+                    open_fds.append(fd)
+
+                    if isinstance(payload, bytes):
+                        os.write(fd, payload)
+                    elif hasattr(payload, '__next__'):
+                        # Streaming payload: write piece by piece so peak
+                        # memory stays bounded by the largest element.
+                        for piece in payload:
+                            os.write(fd, piece)
+                    else:
+                        os.write(fd, json.dumps(payload, indent=2).encode('utf-8'))
+
+                    print(f"  ✓ {filename}")
+                except Exception as e:
+                    print(f"  ✗ Error exporting {filename}: {e}")
+        finally:
+            for fd in open_fds:
+                try:
+                    os.fsync(fd)
+                except OSError:
+                    pass
+                os.close(fd)
+
+    @staticmethod
+    def _dump_model(model) -> bytes:
+        """Serialize one model (pydantic or dataclass) to JSON bytes."""
+        if hasattr(model, 'model_dump_json'):
+            return model.model_dump_json().encode('utf-8')
+        if hasattr(model, 'to_dict'):
+            return json.dumps(model.to_dict()).encode('utf-8')
+        return json.dumps(dict(model)).encode('utf-8')
+
+    def _manifest_payload(self, manifest):
+        """Build manifest.json payload as a stream of JSON pieces.
+
+        The manifest's list sections (components, routes, api_calls, ...)
+        can dominate memory on large projects, so each element is encoded
+        on its own rather than materializing the whole document.
+        """
+        if manifest is None:
+            return None
+        return self._iter_manifest_pieces(manifest)
+
+    @staticmethod
+    def _iter_manifest_pieces(manifest):
+        """Yield manifest.json incrementally, one field or list element at a time."""
+        yield b'{'
+        first_field = True
+
+        for name in type(manifest).model_fields:
+            value = getattr(manifest, name)
+            prefix = b'' if first_field else b','
+            first_field = False
+            key = json.dumps(name).encode('utf-8') + b':'
+
+            if isinstance(value, list):
+                yield prefix + key + b'['
+                for i, item in enumerate(value):
+                    yield ((b',' if i else b'')
+                           + json.dumps(item, default=str).encode('utf-8'))
+                yield b']'
+            else:
+                yield prefix + key + json.dumps(value, default=str).encode('utf-8')
+
+        yield b'}'
+
+    def _summaries_payload(self, summaries: Dict[str, Any]) -> bytes:
+        """Build hierarchical_summaries.json payload.
+
+        Each summary model serializes itself via pydantic-core; the
+        surrounding JSON object is assembled by byte concatenation so the
+        models are never round-tripped through Python dicts.
+        """
         try:
-            output_path = self.output_dir / "file_inventory.json"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(inventory.model_dump(), f, indent=2)
-            print(f"  ✓ file_inventory.json")
+            files = b",".join(
+                self._dump_model(s) for s in summaries.get("file_summaries", [])
+            )
+            folders = b",".join(
+                self._dump_model(s) for s in summaries.get("folder_summaries", [])
+            )
+            project = summaries.get("project_summary")
+            project_bytes = self._dump_model(project) if project is not None else b"{}"
+
+            return (b'{"file_summaries":[' + files
+                    + b'],"folder_summaries":[' + folders
+                    + b'],"project_summary":' + project_bytes + b'}')
         except Exception as e:
-            print(f"  ✗ Error exporting inventory: {e}")
-    
-    def _export_logs(self, vector_index: Dict[str, Any]):
-        """Export scan logs."""
+            print(f"  ✗ Error serializing summaries: {e}")
+            return None
+
+    def _inventory_payload(self, inventory) -> bytes:
+        """Build file_inventory.json payload."""
         try:
-            output_path = self.output_dir / "scan_logs.json"
-            logs = {
-                "timestamp": datetime.now().isoformat(),
-                "total_chunks": vector_index.get("total_chunks", 0),
-                "total_embeddings": vector_index.get("total_embeddings", 0),
-                "status": "completed"
-            }
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(logs, f, indent=2)
-            print(f"  ✓ scan_logs.json")
+            return self._dump_model(inventory)
         except Exception as e:
-            print(f"  ✗ Error exporting logs: {e}")
+            print(f"  ✗ Error serializing inventory: {e}")
+            return None
+
+    def _logs_payload(self, vector_index: Dict[str, Any]) -> Dict[str, Any]:
+        """Build scan_logs.json payload."""
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "total_chunks": vector_index.get("total_chunks", 0),
+            "total_embeddings": vector_index.get("total_embeddings", 0),
+            "status": "completed"
+        }
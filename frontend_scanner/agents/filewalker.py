@@ -1,6 +1,12 @@
 """FileWalker Agent - Recursively scans project directories."""
+import fnmatch
 import hashlib
+import json
 import mimetypes
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -13,6 +19,12 @@ except ImportError:
     GITIGNORE_AVAILABLE = False
     print("Warning: gitignore-parser not available. .gitignore files will be ignored.")
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 
 class FileMetadata(BaseModel):
     """Metadata for a single file."""
@@ -26,6 +38,7 @@ class FileMetadata(BaseModel):
     mime_type: Optional[str] = None
     is_binary: bool = False
     framework_hints: List[str] = Field(default_factory=list)
+    hash_algo: str = "sha256"
 
 
 class FileInventory(BaseModel):
@@ -44,7 +57,37 @@ class FileWalkerAgent:
     def __init__(self, config):
         self.config = config
         self.gitignore_matcher = None
-        
+
+        # One alternation over all exclude globs, precompiled by
+        # SecurityConfig; compiled here only for configs that predate it.
+        exclude_patterns = config.security.exclude_patterns
+        self._exclude_re = getattr(config.security, 'exclude_re', None)
+        if self._exclude_re is None and exclude_patterns:
+            self._exclude_re = re.compile(
+                '|'.join(fnmatch.translate(p) for p in exclude_patterns)
+            )
+
+        # Directory-shaped patterns ("node_modules/**") prune the walk at
+        # the directory itself, so excluded trees are never descended into.
+        dir_patterns = [p[:-3] for p in exclude_patterns if p.endswith('/**')]
+        self._exclude_dir_re = (
+            re.compile('|'.join(fnmatch.translate(p) for p in dir_patterns))
+            if dir_patterns else None
+        )
+        self._supported_extensions = frozenset(config.supported_extensions)
+
+        # Non-crypto identification hashing when requested and available
+        self.hash_algorithm = getattr(config, 'hash_algorithm', 'sha256')
+        if self.hash_algorithm == "xxh3" and not XXHASH_AVAILABLE:
+            print("Warning: xxhash not installed, falling back to sha256")
+            self.hash_algorithm = "sha256"
+
+        # Persistent hash cache keyed by (size, mtime_ns): re-scans of an
+        # unchanged repo skip hashing entirely. Digests depend only on the
+        # configured algorithm, which is recorded in the cache header.
+        self._hash_cache = self._load_hash_cache()
+        self._new_hash_cache = {}
+
         if GITIGNORE_AVAILABLE:
             gitignore_path = Path(config.project_root) / ".gitignore"
             if gitignore_path.exists():
@@ -53,58 +96,145 @@ class FileWalkerAgent:
                 except Exception as e:
                     print(f"Warning: Could not parse .gitignore: {e}")
     
+    def _passes_filters(self, full_path: str, rel_path: str,
+                        name: str, suffix: str, size: int) -> bool:
+        """Shared filter logic for Path- and DirEntry-based checks."""
+        # Check gitignore
+        if self.gitignore_matcher:
+            try:
+                if self.gitignore_matcher(full_path):
+                    return False
+            except:
+                pass
+
+        # Check exclude patterns
+        if self._exclude_re and (self._exclude_re.match(rel_path)
+                                 or self._exclude_re.match(name)):
+            return False
+
+        # Check file size
+        if size > self.config.max_file_size_mb * 1024 * 1024:
+            return False
+
+        # Check extension
+        if suffix and suffix not in self._supported_extensions:
+            return False
+
+        return True
+
     def should_process(self, file_path: Path) -> bool:
         """Check if file should be processed."""
         try:
-            # Check if file exists and is a file
             if not file_path.is_file():
                 return False
-            
-            # Check gitignore
-            if self.gitignore_matcher:
-                try:
-                    if self.gitignore_matcher(str(file_path)):
-                        return False
-                except:
-                    pass
-            
-            # Check exclude patterns
-            from fnmatch import fnmatch
+
             try:
                 rel_path = file_path.relative_to(self.config.project_root)
             except ValueError:
                 return False
-            
-            for pattern in self.config.security.exclude_patterns:
-                if fnmatch(str(rel_path), pattern) or fnmatch(file_path.name, pattern):
-                    return False
-            
-            # Check file size
+
             try:
-                if file_path.stat().st_size > self.config.max_file_size_mb * 1024 * 1024:
-                    return False
-            except:
-                return False
-            
-            # Check extension
-            if file_path.suffix and file_path.suffix not in self.config.supported_extensions:
+                size = file_path.stat().st_size
+            except OSError:
                 return False
-            
-            return True
+
+            return self._passes_filters(
+                str(file_path), str(rel_path), file_path.name,
+                file_path.suffix, size
+            )
+        except Exception:
+            return False
+
+    def _should_process_entry(self, entry: os.DirEntry, root: Path) -> bool:
+        """DirEntry variant of should_process, reusing the cached stat."""
+        try:
+            rel_path = os.path.relpath(entry.path, root)
+            suffix = os.path.splitext(entry.name)[1]
+            return self._passes_filters(
+                entry.path, rel_path, entry.name, suffix,
+                entry.stat().st_size
+            )
         except Exception:
             return False
+
+    def _dir_excluded(self, entry: os.DirEntry) -> bool:
+        """Whether a directory should be pruned from the walk entirely."""
+        if self._exclude_dir_re and self._exclude_dir_re.match(entry.name):
+            return True
+
+        if self.gitignore_matcher:
+            try:
+                if self.gitignore_matcher(entry.path):
+                    return True
+            except:
+                pass
+
+        return False
+
+    def _iter_entries(self, dir_path: str):
+        """Recursive os.scandir walk yielding file DirEntry objects.
+
+        DirEntry carries type and stat info from getdents, so the walk
+        avoids the per-file stat syscalls that Path.rglob incurs.
+        """
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self._dir_excluded(entry):
+                                continue
+                            yield from self._iter_entries(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            return
     
+    # Files up to this size are hashed from a single read; larger ones are
+    # mmap'd so the digest still sees one contiguous buffer without
+    # doubling resident memory.
+    HASH_READ_LIMIT = 8 * 1024 * 1024
+
+    # hashlib.file_digest (3.11+) streams in a C fast path with the GIL
+    # released and OpenSSL's accelerated SHA256 (SHA-NI/ARMv8 SHA2).
+    _HAS_FILE_DIGEST = hasattr(hashlib, "file_digest")
+
     def compute_hash(self, file_path: Path) -> str:
-        """Compute SHA256 hash of file."""
-        sha256 = hashlib.sha256()
+        """Compute the configured content hash (sha256 or xxh3) of a file."""
         try:
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+                # On Linux, tell the kernel we'll read straight through so
+                # it readahead-prefetches aggressively on cold caches.
+                if hasattr(os, 'posix_fadvise'):
+                    try:
+                        os.posix_fadvise(f.fileno(), 0, 0,
+                                         os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        pass
+
+                if self.hash_algorithm == "xxh3":
+                    return self._digest_buffer(f, xxhash.xxh3_128)
+
+                if self._HAS_FILE_DIGEST:
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+
+                return self._digest_buffer(f, hashlib.sha256)
         except Exception as e:
             print(f"Error hashing {file_path}: {e}")
             return ""
+
+    def _digest_buffer(self, f, hasher) -> str:
+        """Digest an open file as one buffer (read small, mmap large)."""
+        size = os.fstat(f.fileno()).st_size
+
+        if size <= self.HASH_READ_LIMIT:
+            # One C-level read feeds the whole buffer to the hasher
+            return hasher(f.read()).hexdigest()
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hasher(mm).hexdigest()
     
     def detect_framework_hints(self, file_path: Path) -> List[str]:
         """Detect framework hints from file path and name."""
@@ -126,65 +256,192 @@ class FileWalkerAgent:
         
         return hints
     
+    HASH_CACHE_NAME = "filewalker.cache.json"
+    HASH_CACHE_VERSION = 1
+
+    def _hash_cache_path(self) -> Path:
+        """Location of the persistent hash cache."""
+        cache_dir = getattr(self.config, 'scan_cache_dir', self.config.output_dir)
+        return Path(cache_dir) / self.HASH_CACHE_NAME
+
+    def _load_hash_cache(self) -> Dict[str, Any]:
+        """Load the (size, mtime_ns) -> digest cache from a previous scan."""
+        try:
+            with open(self._hash_cache_path(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != self.HASH_CACHE_VERSION:
+                return {}
+            if data.get("algo", "sha256") != self.hash_algorithm:
+                return {}
+            return data.get("files", {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Warning: Could not load hash cache: {e}")
+            return {}
+
+    def _save_hash_cache(self):
+        """Persist hashes recorded during this scan."""
+        if not self._new_hash_cache:
+            return
+        try:
+            cache_path = self._hash_cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "version": self.HASH_CACHE_VERSION,
+                    "algo": self.hash_algorithm,
+                    "files": self._new_hash_cache
+                }, f)
+        except Exception as e:
+            print(f"Warning: Could not save hash cache: {e}")
+
+    def _hash_with_cache(self, file_path: Path, stat) -> str:
+        """Return the file's digest, reusing the cache when size+mtime match."""
+        key = str(file_path)
+        cached = self._hash_cache.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            digest = cached[2]
+        else:
+            digest = self.compute_hash(file_path)
+
+        if digest:
+            self._new_hash_cache[key] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    # Extensions that are always binary: classified by one frozenset
+    # lookup, no header sniffing or mime guessing required
+    BINARY_EXTS = frozenset({
+        '.png', '.jpg', '.jpeg', '.gif', '.webp', '.woff', '.woff2',
+        '.ttf', '.eot', '.ico', '.mp4', '.webm', '.pdf', '.zip',
+    })
+
+    # Small files are submitted to the hash pool in batches so executor
+    # dispatch overhead doesn't dominate node_modules-like trees; large
+    # files still get a task each to keep the pool balanced.
+    HASH_BATCH_SIZE = 16
+    HASH_BATCH_MAX_FILE_SIZE = 64 * 1024
+
+    def _build_metadata_batch(self, batch, root: Path):
+        """Process a batch of (path, stat) pairs in one pool task."""
+        results = []
+        errors = []
+        for file_path, stat in batch:
+            try:
+                results.append(self._build_metadata(file_path, root, stat))
+            except Exception as e:
+                errors.append({"file": str(file_path), "error": str(e)})
+        return results, errors
+
+    def _build_metadata(self, file_path: Path, root: Path,
+                        stat=None) -> Dict[str, Any]:
+        """Hash one file and assemble its metadata dict (thread-pool worker).
+
+        Workers emit plain dicts; validation happens once for the whole
+        inventory in scan() instead of per-file.
+        """
+        if stat is None:
+            stat = file_path.stat()
+
+        ext = file_path.suffix.lower()
+        if ext in self.BINARY_EXTS:
+            # Known-binary extension: skip the mime probe entirely
+            mime_type, is_binary = None, True
+        else:
+            mime_type, _ = mimetypes.guess_type(str(file_path))
+            is_binary = mime_type and not mime_type.startswith('text') if mime_type else False
+
+        return {
+            "path": str(file_path),
+            "relative_path": str(file_path.relative_to(root)),
+            "file_type": file_path.suffix[1:] if file_path.suffix else "unknown",
+            "extension": file_path.suffix,
+            "size_bytes": stat.st_size,
+            "last_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "sha256_hash": self._hash_with_cache(file_path, stat),
+            "mime_type": mime_type,
+            "is_binary": is_binary,
+            "framework_hints": self.detect_framework_hints(file_path),
+            "hash_algo": self.hash_algorithm,
+        }
+
     def scan(self) -> FileInventory:
-        """Execute file walk and produce inventory."""
+        """Execute file walk and produce inventory.
+
+        Phase 1 walks the tree single-threaded collecting eligible paths;
+        phase 2 hashes and builds metadata across a thread pool (hashlib
+        releases the GIL, so hashing scales with cores).
+        """
         root = Path(self.config.project_root).resolve()
-        
+
         if not root.exists():
             raise ValueError(f"Project root does not exist: {root}")
-        
+
         files = []
         total_size = 0
         errors = []
-        
+
         print(f"Scanning: {root}")
-        
+
+        eligible = []
         try:
-            for file_path in root.rglob('*'):
-                if not file_path.is_file():
-                    continue
-                
+            for entry in self._iter_entries(str(root)):
                 try:
-                    if not self.should_process(file_path):
-                        continue
-                    
-                    stat = file_path.stat()
-                    mime_type, _ = mimetypes.guess_type(str(file_path))
-                    is_binary = mime_type and not mime_type.startswith('text') if mime_type else False
-                    
-                    metadata = FileMetadata(
-                        path=str(file_path),
-                        relative_path=str(file_path.relative_to(root)),
-                        file_type=file_path.suffix[1:] if file_path.suffix else "unknown",
-                        extension=file_path.suffix,
-                        size_bytes=stat.st_size,
-                        last_modified=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        sha256_hash=self.compute_hash(file_path),
-                        mime_type=mime_type,
-                        is_binary=is_binary,
-                        framework_hints=self.detect_framework_hints(file_path)
-                    )
-                    
-                    files.append(metadata)
-                    total_size += stat.st_size
-                    
+                    if self._should_process_entry(entry, root):
+                        # Keep the DirEntry's cached stat so phase 2 never
+                        # re-stats the file.
+                        eligible.append((Path(entry.path), entry.stat()))
                 except Exception as e:
                     errors.append({
-                        "file": str(file_path),
+                        "file": entry.path,
                         "error": str(e)
                     })
-        
         except Exception as e:
             errors.append({
                 "scan": "global",
                 "error": str(e)
             })
-        
-        return FileInventory(
-            project_root=str(root),
-            scan_timestamp=datetime.now().isoformat(),
-            total_files=len(files),
-            total_size_bytes=total_size,
-            files=files,
-            errors=errors
-        )
+
+        if eligible:
+            # Bucket by size class: batches of small files, one task per
+            # large file.
+            small = []
+            batches = []
+            for item in eligible:
+                if item[1].st_size <= self.HASH_BATCH_MAX_FILE_SIZE:
+                    small.append(item)
+                else:
+                    batches.append([item])
+            batches.extend(
+                small[i:i + self.HASH_BATCH_SIZE]
+                for i in range(0, len(small), self.HASH_BATCH_SIZE)
+            )
+
+            max_workers = min(len(batches), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(self._build_metadata_batch, batch, root)
+                    for batch in batches
+                ]
+                for future in as_completed(futures):
+                    results, batch_errors = future.result()
+                    for metadata in results:
+                        files.append(metadata)
+                        total_size += metadata["size_bytes"]
+                    errors.extend(batch_errors)
+
+        # as_completed returns in finish order; keep the inventory stable
+        files.sort(key=lambda f: f["path"])
+
+        self._save_hash_cache()
+
+        # One batched validation in pydantic-core instead of a model build
+        # per file.
+        return FileInventory.model_validate({
+            "project_root": str(root),
+            "scan_timestamp": datetime.now().isoformat(),
+            "total_files": len(files),
+            "total_size_bytes": total_size,
+            "files": files,
+            "errors": errors,
+        })
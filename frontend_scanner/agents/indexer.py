@@ -83,18 +83,22 @@ class IndexerAgent:
         
         project_summary = summaries.get("project_summary")
         
+        MAX_API_CALLS = 20
+
         routes = []
         pages = []
         components = []
-        api_calls = set()
-        
+        # dict.fromkeys-style ordered dedup: deterministic output, no
+        # set->list reshuffle
+        api_calls = {}
+
         for parsed in parsed_files:
             if not parsed:
                 continue
-            
+
             try:
                 routes.extend(parsed.routes)
-                
+
                 for comp in parsed.components:
                     components.append({
                         "name": comp.name,
@@ -102,10 +106,13 @@ class IndexerAgent:
                         "line": comp.start_line,
                         "type": comp.type
                     })
-                
-                for call in parsed.api_calls:
-                    api_calls.add(call.get("url", "")[:100])
-            
+
+                if len(api_calls) < MAX_API_CALLS:
+                    for call in parsed.api_calls:
+                        api_calls.setdefault(call.get("url", "")[:100])
+                        if len(api_calls) >= MAX_API_CALLS:
+                            break
+
             except Exception as e:
                 print(f"Error processing {parsed.file_path}: {e}")
                 continue
@@ -126,10 +133,10 @@ class IndexerAgent:
             project_root=str(self.config.project_root),
             scan_timestamp=datetime.now().isoformat(),
             framework=framework,
-            routes=list(set(routes)),
+            routes=list(dict.fromkeys(routes)),
             pages=pages,
             components=components[:50],
-            api_calls=list(api_calls)[:20],
+            api_calls=list(api_calls),
             suggested_backend_endpoints=suggested_endpoints,
             integration_hints={
                 "detected_framework": framework,
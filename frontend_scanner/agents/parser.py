@@ -1,6 +1,12 @@
 """Parser Agent - AST extraction using tree-sitter."""
 from __future__ import annotations
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
 from pathlib import Path
+
+import numpy as np
 from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from pydantic import BaseModel, Field
 
@@ -16,6 +22,16 @@ except ImportError:
     TREE_SITTER_AVAILABLE = False
     print("Warning: tree-sitter not available. AST parsing will be limited.")
 
+try:
+    from tree_sitter import Query  # type: ignore
+except ImportError:
+    Query = None
+
+try:
+    from tree_sitter import QueryCursor  # type: ignore
+except ImportError:
+    QueryCursor = None
+
 
 class ComponentMetadata(BaseModel):
     """Metadata for a React/Vue/Svelte component."""
@@ -49,28 +65,112 @@ class ParsedFile(BaseModel):
 class ParserAgent:
     """Agent that parses code files and extracts AST metadata."""
     
+    # Each extraction family runs as one alternation so a file is scanned
+    # once per family instead of once per pattern; match dispatch keys off
+    # the named group that fired.
+    _COMPONENT_RE = re.compile(
+        r'function\s+(?P<fn>\w+)\s*\([^)]*\)\s*{'
+        r'|const\s+(?P<arrow>\w+)\s*=\s*\([^)]*\)\s*=>'
+        r'|export\s+default\s+function\s+(?P<default_fn>\w+)'
+    )
+    _EXPORT_RE = re.compile(
+        r'export\s+default\s+\w+'
+        r'|export\s+{[^}]+}'
+        r'|export\s+const\s+\w+'
+        r'|export\s+function\s+\w+'
+    )
+    _API_CALL_RE = re.compile(
+        r'fetch\s*\(\s*["\'](?P<fetch>[^"\']+)["\']'
+        r'|axios\.\w+\s*\(\s*["\'](?P<axios>[^"\']+)["\']'
+        r'|\.get\s*\(\s*["\'](?P<get>[^"\']+)["\']'
+        r'|\.post\s*\(\s*["\'](?P<post>[^"\']+)["\']'
+    )
+    _IMPORT_RE = re.compile(r'import\s+.*?\s+from\s+["\'](.+?)["\']')
+    _ENV_RE = re.compile(r'(?:process\.env|import\.meta\.env)\.(\w+)')
+    _HOOK_RE = re.compile(r'\b(use[A-Z]\w+)\s*\(')
+    _ROUTE_TAG_RE = re.compile(r'<Route\s+path=["\'](.*?)["\']')
+    _ROUTE_PATH_RE = re.compile(r'["\']?path["\']?\s*:\s*["\']([^"\']+)["\']')
+    # Case-insensitive scans over the original content avoid allocating a
+    # full lowercased copy per file just for framework sniffing.
+    _NEXT_TOKEN_RE = re.compile(r'next', re.IGNORECASE)
+    _REACT_TOKEN_RE = re.compile(r'react|useState|useEffect', re.IGNORECASE)
+
+    # Bound on the content-hash parse memo below
+    PARSE_CACHE_SIZE = 256
+
     def __init__(self, config):
         self.config = config
         self.parsers_available = TREE_SITTER_AVAILABLE
-        
+
+        # Identical file contents (vendored/duplicated files) parse once
+        # per extension — the extension picks the grammar and language, so
+        # it belongs in the key (every empty .ts/.jsx/.json shares one
+        # sha256). Hits are cloned with path-dependent fields re-derived.
+        # parse() runs concurrently from the workflow's thread pool, so
+        # every compound cache operation happens under the lock — an
+        # eviction interleaving with a hit must never surface as a file
+        # error.
+        self._parse_cache: "OrderedDict[tuple, ParsedFile]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+
         if self.parsers_available:
             self._setup_parsers()
         else:
             print("Tree-sitter parsers not available. Using fallback parsing.")
     
+    _IMPORT_QUERY_SRC = "(import_statement source: (string) @src)"
+
     def _setup_parsers(self):
-        """Initialize tree-sitter parsers."""
+        """Initialize tree-sitter parsers and compile queries once."""
         try:
             self.js_language = Language(tsjs.language())
             self.ts_language = Language(tsts.language_typescript())
             self.tsx_language = Language(tsts.language_tsx())
-            
+
             self.js_parser = Parser(self.js_language)
             self.ts_parser = Parser(self.ts_language)
             self.tsx_parser = Parser(self.tsx_language)
+
+            # Queries compile to native matchers; build them once per
+            # language rather than per file.
+            self._import_queries = {}
+            for language in (self.js_language, self.ts_language, self.tsx_language):
+                query = self._compile_query(language, self._IMPORT_QUERY_SRC)
+                if query is not None:
+                    self._import_queries[id(language)] = query
         except Exception as e:
             print(f"Error setting up parsers: {e}")
             self.parsers_available = False
+
+    @staticmethod
+    def _compile_query(language, source: str):
+        """Compile a tree-sitter query across py-tree-sitter API versions."""
+        if Query is not None:
+            try:
+                return Query(language, source)
+            except Exception:
+                pass
+        try:
+            return language.query(source)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _query_captures(query, node):
+        """Run a compiled query, normalizing captures to a name->nodes dict."""
+        if QueryCursor is not None:
+            captures = QueryCursor(query).captures(node)
+        else:
+            captures = query.captures(node)
+
+        if isinstance(captures, dict):
+            return captures
+
+        # Older API: list of (node, capture_name) pairs
+        grouped: Dict[str, List[Any]] = {}
+        for item_node, name in captures:
+            grouped.setdefault(name, []).append(item_node)
+        return grouped
     
     def get_parser(self, extension: str) -> Optional[Tuple[Parser, Language]]:
         """Get appropriate parser for file extension."""
@@ -87,35 +187,101 @@ class ParserAgent:
         except:
             return None
     
-    def parse(self, file_path: str, content: str) -> ParsedFile:
-        """Parse a file and extract metadata."""
+    @staticmethod
+    def _newline_offsets(content: str) -> List[int]:
+        """Offsets of every newline, computed in one pass.
+
+        Lets match positions map to line numbers in O(log n) via bisect
+        instead of the quadratic content[:start].count('\\n') per match.
+        """
+        offsets = []
+        idx = content.find('\n')
+        while idx != -1:
+            offsets.append(idx)
+            idx = content.find('\n', idx + 1)
+        return offsets
+
+    @staticmethod
+    def _line_number(newline_offsets, pos: int) -> int:
+        """1-based line number of a character offset."""
+        if isinstance(newline_offsets, np.ndarray):
+            return int(np.searchsorted(newline_offsets, pos, side='left')) + 1
+        return bisect_left(newline_offsets, pos) + 1
+
+    def _clone_cached(self, cached: ParsedFile, file_path: str,
+                      content: str) -> ParsedFile:
+        """Clone a cache hit, re-deriving the path-dependent fields."""
+        parsed = cached.model_copy(deep=True)
+        parsed.file_path = file_path
+
+        path = Path(file_path)
+        parsed.framework = self._detect_framework(path, content)
+        parsed.routes = []
+        if parsed.framework == "nextjs":
+            parsed.routes = self._extract_nextjs_routes(path)
+        elif parsed.framework == "react":
+            parsed.routes = self._extract_react_router_routes(content)
+        parsed.ast_summary = self._generate_ast_summary(parsed)
+        return parsed
+
+    def parse(self, file_path: str, content: str,
+              content_hash: Optional[str] = None,
+              content_bytes: Optional[bytes] = None) -> ParsedFile:
+        """Parse a file and extract metadata.
+
+        ``content_hash`` (the FileWalker's sha256) enables memoization:
+        files with identical content and extension parse once per scan.
+        Callers that already hold the raw file bytes can pass
+        ``content_bytes`` so tree-sitter parses them directly instead of
+        re-encoding ``content``.
+        """
         path = Path(file_path)
         extension = path.suffix
-        
+
+        cache_key = (content_hash, extension) if content_hash else None
+        if cache_key:
+            with self._parse_cache_lock:
+                cached = self._parse_cache.get(cache_key)
+                if cached is not None:
+                    self._parse_cache.move_to_end(cache_key)
+            if cached is not None:
+                return self._clone_cached(cached, file_path, content)
+
         parsed = ParsedFile(
             file_path=file_path,
             language=self._detect_language(extension),
             framework=self._detect_framework(path, content)
         )
-        
+
         try:
+            # When the raw bytes are pure ASCII, byte and char offsets
+            # coincide and newline enumeration becomes one vectorized
+            # compare over the buffer; otherwise fall back to the str scan.
+            if content_bytes is not None and len(content_bytes) == len(content):
+                arr = np.frombuffer(content_bytes, dtype=np.uint8)
+                newline_offsets = np.nonzero(arr == 10)[0]
+            else:
+                newline_offsets = self._newline_offsets(content)
+
             if self.parsers_available:
                 parser_tuple = self.get_parser(extension)
                 if parser_tuple:
                     parser, language = parser_tuple
-                    tree = parser.parse(bytes(content, "utf8"))
+                    if content_bytes is None:
+                        content_bytes = content.encode('utf-8', errors='ignore')
+                    tree = parser.parse(content_bytes)
                     root_node = tree.root_node
-                    
-                    parsed.components = self._extract_components(root_node, content, language)
-                    parsed.imports = self._extract_imports(root_node, content, language)
+
+                    parsed.components = self._extract_components(root_node, content, language, newline_offsets)
+                    parsed.imports = self._extract_imports(root_node, content, language, newline_offsets)
                     parsed.exports = self._extract_exports(root_node, content, language)
-                    parsed.api_calls = self._extract_api_calls(content)
+                    parsed.api_calls = self._extract_api_calls(content, newline_offsets)
                     parsed.env_vars = self._extract_env_vars(content)
             else:
                 # Fallback parsing
-                parsed.api_calls = self._extract_api_calls(content)
+                parsed.api_calls = self._extract_api_calls(content, newline_offsets)
                 parsed.env_vars = self._extract_env_vars(content)
-                parsed.imports = self._extract_imports_regex(content)
+                parsed.imports = self._extract_imports_regex(content, newline_offsets)
             
             # Extract routes based on framework
             if parsed.framework == "nextjs":
@@ -124,10 +290,19 @@ class ParserAgent:
                 parsed.routes = self._extract_react_router_routes(content)
             
             parsed.ast_summary = self._generate_ast_summary(parsed)
-            
+
         except Exception as e:
             parsed.parse_errors.append(str(e))
-        
+
+        if cache_key and not parsed.parse_errors:
+            # Store a private copy so caller-side mutation of the returned
+            # object can't poison later cache hits.
+            private_copy = parsed.model_copy(deep=True)
+            with self._parse_cache_lock:
+                self._parse_cache[cache_key] = private_copy
+                if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                    self._parse_cache.popitem(last=False)
+
         return parsed
     
     def _detect_language(self, extension: str) -> str:
@@ -147,148 +322,122 @@ class ParserAgent:
     def _detect_framework(self, path: Path, content: str) -> Optional[str]:
         """Detect framework from file path and content."""
         path_str = str(path).lower()
-        content_lower = content.lower()
-        
-        if '/pages/' in path_str or '/app/' in path_str or 'next' in content_lower:
+
+        if '/pages/' in path_str or '/app/' in path_str \
+                or self._NEXT_TOKEN_RE.search(content):
             return "nextjs"
-        if 'react' in content_lower or 'usestate' in content_lower or 'useeffect' in content_lower:
+        if self._REACT_TOKEN_RE.search(content):
             return "react"
         if path.suffix == '.vue':
             return "vue"
         if path.suffix == '.svelte':
             return "svelte"
-        
+
         return None
     
-    def _extract_components(self, root_node, content: str, language) -> List[ComponentMetadata]:
+    def _extract_components(self, root_node, content: str, language,
+                            newline_offsets: Optional[List[int]] = None) -> List[ComponentMetadata]:
         """Extract components from AST."""
         components = []
-        
-        # Use regex-based extraction as it's more reliable
-        import re
-        
-        # Match function components
-        patterns = [
-            r'function\s+(\w+)\s*\([^)]*\)\s*{',
-            r'const\s+(\w+)\s*=\s*\([^)]*\)\s*=>',
-            r'export\s+default\s+function\s+(\w+)',
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, content):
-                name = match.group(1)
-                line_num = content[:match.start()].count('\n') + 1
-                components.append(ComponentMetadata(
-                    name=name,
-                    type="function",
-                    start_line=line_num,
-                    end_line=line_num,
-                    hooks=self._extract_hooks(content)
-                ))
-                if len(components) >= 20:
-                    break
+
+        if newline_offsets is None:
+            newline_offsets = self._newline_offsets(content)
+
+        # Regex-based extraction: a single combined pass over the content
+        hooks = self._extract_hooks(content)
+
+        for match in self._COMPONENT_RE.finditer(content):
+            name = match.group(match.lastgroup)
+            line_num = self._line_number(newline_offsets, match.start())
+            components.append(ComponentMetadata(
+                name=name,
+                type="function",
+                start_line=line_num,
+                end_line=line_num,
+                hooks=hooks
+            ))
             if len(components) >= 20:
                 break
-        
+
         return components[:20]  # Limit to 20 components
     
-    def _extract_imports(self, root_node, content: str, language) -> List[Dict[str, Any]]:
+    def _extract_imports(self, root_node, content: str, language,
+                         newline_offsets: Optional[List[int]] = None) -> List[Dict[str, Any]]:
         """Extract import statements."""
-        # Use regex-based extraction (more reliable than tree-sitter queries)
-        return self._extract_imports_regex(content)
-    
-    def _extract_imports_regex(self, content: str) -> List[Dict[str, Any]]:
+        query = getattr(self, '_import_queries', {}).get(id(language))
+
+        if root_node is not None and query is not None:
+            try:
+                nodes = self._query_captures(query, root_node).get("src", [])
+                return [
+                    {
+                        "source": node.text.decode('utf-8', errors='ignore').strip('"\''),
+                        "line": node.start_point[0] + 1
+                    }
+                    for node in nodes[:51]
+                ]
+            except Exception:
+                pass  # Fall back to regex below
+
+        return self._extract_imports_regex(content, newline_offsets)
+
+    def _extract_imports_regex(self, content: str,
+                               newline_offsets: Optional[List[int]] = None) -> List[Dict[str, Any]]:
         """Fallback import extraction using regex."""
-        import re
         imports = []
-        
-        pattern = r'import\s+.*?\s+from\s+["\'](.+?)["\']'
-        matches = re.finditer(pattern, content)
-        
-        for i, match in enumerate(matches):
+
+        if newline_offsets is None:
+            newline_offsets = self._newline_offsets(content)
+
+        for i, match in enumerate(self._IMPORT_RE.finditer(content)):
             imports.append({
                 "source": match.group(1),
-                "line": content[:match.start()].count('\n') + 1
+                "line": self._line_number(newline_offsets, match.start())
             })
             if i >= 50:
                 break
-        
+
         return imports
     
     def _extract_exports(self, root_node, content: str, language) -> List[str]:
         """Extract export declarations."""
-        import re
         exports = []
-        
-        patterns = [
-            r'export\s+default\s+\w+',
-            r'export\s+{[^}]+}',
-            r'export\s+const\s+\w+',
-            r'export\s+function\s+\w+',
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, content):
-                export_text = match.group(0)
-                if export_text:
-                    exports.append(export_text[:100])
-                if len(exports) >= 20:
-                    break
+
+        for match in self._EXPORT_RE.finditer(content):
+            export_text = match.group(0)
+            if export_text:
+                exports.append(export_text[:100])
             if len(exports) >= 20:
                 break
-        
+
         return exports[:20]
     
-    def _extract_api_calls(self, content: str) -> List[Dict[str, Any]]:
+    def _extract_api_calls(self, content: str,
+                           newline_offsets: Optional[List[int]] = None) -> List[Dict[str, Any]]:
         """Extract fetch/axios/API calls using regex."""
-        import re
         api_calls = []
-        
-        patterns = [
-            r'fetch\s*\(\s*["\']([^"\']+)["\']',
-            r'axios\.\w+\s*\(\s*["\']([^"\']+)["\']',
-            r'\.get\s*\(\s*["\']([^"\']+)["\']',
-            r'\.post\s*\(\s*["\']([^"\']+)["\']',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, content)
-            for i, match in enumerate(matches):
-                api_calls.append({
-                    "call": match.group(0)[:200],
-                    "url": match.group(1),
-                    "line": content[:match.start()].count('\n') + 1
-                })
-                if len(api_calls) >= 20:
-                    break
+
+        if newline_offsets is None:
+            newline_offsets = self._newline_offsets(content)
+
+        for match in self._API_CALL_RE.finditer(content):
+            api_calls.append({
+                "call": match.group(0)[:200],
+                "url": match.group(match.lastgroup),
+                "line": self._line_number(newline_offsets, match.start())
+            })
             if len(api_calls) >= 20:
                 break
-        
+
         return api_calls
     
     def _extract_env_vars(self, content: str) -> List[str]:
         """Extract environment variable usage."""
-        import re
-        env_vars = []
-        
-        matches = re.findall(r'process\.env\.(\w+)', content)
-        env_vars.extend(matches)
-        
-        matches = re.findall(r'import\.meta\.env\.(\w+)', content)
-        env_vars.extend(matches)
-        
-        return list(set(env_vars))[:20]
-    
+        return list(set(self._ENV_RE.findall(content)))[:20]
+
     def _extract_hooks(self, code: str) -> List[str]:
         """Extract React hooks usage."""
-        import re
-        hooks = []
-        
-        hook_pattern = r'\b(use[A-Z]\w+)\s*\('
-        matches = re.findall(hook_pattern, code)
-        hooks.extend(matches)
-        
-        return list(set(hooks))[:10]
+        return list(set(self._HOOK_RE.findall(code)))[:10]
     
     def _extract_nextjs_routes(self, path: Path) -> List[str]:
         """Extract Next.js routes from file path."""
@@ -306,19 +455,14 @@ class ParserAgent:
     
     def _extract_react_router_routes(self, content: str) -> List[str]:
         """Extract routes from React Router configuration."""
-        import re
         routes = []
-        
+
         # Match <Route path="..." />
-        pattern = r'<Route\s+path=["\'](.*?)["\']'
-        matches = re.findall(pattern, content)
-        routes.extend(matches)
-        
+        routes.extend(self._ROUTE_TAG_RE.findall(content))
+
         # Match routes object/array patterns: path: "..." or "path": "..."
-        pattern2 = r'["\']?path["\']?\s*:\s*["\']([^"\']+)["\']'
-        matches2 = re.findall(pattern2, content)
-        routes.extend(matches2)
-        
+        routes.extend(self._ROUTE_PATH_RE.findall(content))
+
         return routes
     
     def _get_node_text(self, node, content: str) -> str:
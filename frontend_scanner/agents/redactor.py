@@ -1,45 +1,159 @@
 """Redactor Agent - Remove secrets and sensitive data."""
+import dataclasses
+import os
 import re
-from typing import List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional
 from frontend_scanner.agents.chunker import CodeChunk
+from frontend_scanner.agents import redactor_hyperscan
+
+# Per-process RedactorAgent for the multiprocessing shard path, built once
+# per worker by the pool initializer
+_worker_redactor = None
+
+
+def _init_redact_worker(config):
+    """Initialize the per-process RedactorAgent."""
+    global _worker_redactor
+    _worker_redactor = RedactorAgent(config)
+
+
+def _redact_shard(shard):
+    """Redact one shard of chunks in a pool worker."""
+    return [_worker_redactor.redact(chunk) for chunk in shard]
 
 
 class RedactorAgent:
     """Agent that sanitizes sensitive information from code chunks."""
-    
+
     def __init__(self, config):
         self.config = config
         self.patterns = []
-        
+        self._combined_re: Optional[re.Pattern] = None
+
         if self.config.security.redact_secrets:
             self.patterns = [
                 re.compile(p) for p in self.config.security.redact_patterns
             ]
-    
+            # SecurityConfig precompiles the union; combine here only for
+            # configs that predate it.
+            self._combined_re = getattr(config.security, 'redact_re', None)
+            if self._combined_re is None:
+                self._combined_re = self._combine_patterns(
+                    self.config.security.redact_patterns
+                )
+
+            # Single-pass vectorized DFA when the optional hyperscan
+            # binding is installed; None otherwise
+            self._hs_db = redactor_hyperscan.build_database(
+                self.config.security.redact_patterns
+            )
+
+    @staticmethod
+    def _combine_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+        """Fuse all redact patterns into one alternation.
+
+        Leading global flags like ``(?i)`` are rewritten to scoped groups
+        so they survive the union; one DFA-ish scan replaces N passes.
+        Returns None if the union doesn't compile (fall back to per-pattern
+        substitution).
+        """
+        if not patterns:
+            return None
+
+        parts = []
+        for pattern in patterns:
+            if pattern.startswith('(?i)'):
+                parts.append('(?i:' + pattern[4:] + ')')
+            else:
+                parts.append('(?:' + pattern + ')')
+
+        try:
+            return re.compile('|'.join(parts))
+        except re.error as e:
+            print(f"Warning: Could not combine redact patterns: {e}")
+            return None
+
+    # Below this many chunks the pool costs more than it saves
+    PARALLEL_REDACT_THRESHOLD = 64
+    # Above this many chunks, full process parallelism beats threads
+    PROCESS_REDACT_THRESHOLD = 5000
+
+    def redact_batch(self, chunks: List[CodeChunk]) -> List[CodeChunk]:
+        """Redact a batch of chunks, fanning out across threads.
+
+        re.sub on large strings runs in C without holding the interpreter
+        hot, so redaction scales across a thread pool for big batches;
+        huge batches shard across processes for full core utilization.
+        """
+        if not self.config.security.redact_secrets or not self.patterns or not chunks:
+            return list(chunks)
+
+        cpus = os.cpu_count() or 1
+        if len(chunks) < self.PARALLEL_REDACT_THRESHOLD or cpus < 2:
+            return [self.redact(chunk) for chunk in chunks]
+
+        if len(chunks) >= self.PROCESS_REDACT_THRESHOLD:
+            workers = self.config.security.redact_workers or cpus
+            shard_size = -(-len(chunks) // workers)
+            shards = [chunks[i:i + shard_size]
+                      for i in range(0, len(chunks), shard_size)]
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_redact_worker,
+                    initargs=(self.config,)
+                ) as pool:
+                    redacted = []
+                    for shard in pool.map(_redact_shard, shards):
+                        redacted.extend(shard)
+                    return redacted
+            except Exception as e:
+                print(f"Warning: process-pool redaction failed ({e}), using threads")
+
+        with ThreadPoolExecutor(max_workers=cpus) as pool:
+            return list(pool.map(self.redact, chunks))
+
     def redact(self, chunk: CodeChunk) -> CodeChunk:
         """Redact sensitive information from a chunk."""
         if not self.config.security.redact_secrets or not self.patterns:
             return chunk
-        
+
         redacted_content = chunk.content
-        
+        substitutions = 0
+
+        if self._hs_db is not None:
+            result = redactor_hyperscan.redact_text(self._hs_db, chunk.content)
+            if result is not None:
+                redacted_content, substitutions = result
+                if substitutions == 0:
+                    return chunk
+                return dataclasses.replace(
+                    chunk,
+                    content=redacted_content,
+                    metadata={**chunk.metadata, "redacted": True}
+                )
+            # Scan failed; fall through to the regex engine
+
         try:
-            for pattern in self.patterns:
-                redacted_content = pattern.sub('[REDACTED]', redacted_content)
+            if self._combined_re is not None:
+                redacted_content, substitutions = self._combined_re.subn(
+                    '[REDACTED]', redacted_content
+                )
+            else:
+                for pattern in self.patterns:
+                    redacted_content, n = pattern.subn('[REDACTED]', redacted_content)
+                    substitutions += n
         except Exception as e:
             print(f"Error redacting chunk {chunk.chunk_id}: {e}")
             return chunk
-        
-        # Create new chunk with redacted content
-        return CodeChunk(
-            chunk_id=chunk.chunk_id,
-            file_path=chunk.file_path,
+
+        # Most chunks contain no secrets — skip the copy entirely
+        if substitutions == 0:
+            return chunk
+
+        return dataclasses.replace(
+            chunk,
             content=redacted_content,
-            start_line=chunk.start_line,
-            end_line=chunk.end_line,
-            token_count=chunk.token_count,
-            chunk_type=chunk.chunk_type,
-            language=chunk.language,
-            metadata={**chunk.metadata, "redacted": True},
-            provenance=chunk.provenance
+            metadata={**chunk.metadata, "redacted": True}
         )
@@ -0,0 +1,81 @@
+"""Optional Hyperscan-backed multi-pattern redaction engine.
+
+Hyperscan compiles every secret pattern into one vectorized DFA and finds
+all matches in a single pass per chunk. Everything here degrades to None
+when the `hyperscan` binding isn't installed; RedactorAgent falls back to
+its combined-regex engine in that case.
+"""
+from typing import List, Optional, Tuple
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+REDACTED = b'[REDACTED]'
+
+
+def build_database(patterns: List[str]):
+    """Compile the pattern set into a Hyperscan block-mode database.
+
+    Returns None when hyperscan is unavailable or any pattern falls
+    outside its supported syntax.
+    """
+    if not HYPERSCAN_AVAILABLE or not patterns:
+        return None
+
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode('utf-8') for p in patterns],
+            ids=list(range(len(patterns))),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(patterns)
+        )
+        return db
+    except Exception:
+        return None
+
+
+def _merge_spans(spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merge overlapping (start, end) byte spans."""
+    spans.sort()
+    merged = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def redact_text(db, text: str) -> Optional[Tuple[str, int]]:
+    """Redact text with one DFA scan.
+
+    Returns (redacted_text, substitutions) or None if the scan failed and
+    the caller should fall back to the regex engine.
+    """
+    data = text.encode('utf-8', errors='ignore')
+    spans: List[Tuple[int, int]] = []
+
+    def on_match(pattern_id, start, end, flags, context):
+        spans.append((start, end))
+
+    try:
+        db.scan(data, match_event_handler=on_match)
+    except Exception:
+        return None
+
+    if not spans:
+        return text, 0
+
+    merged = _merge_spans(spans)
+    pieces = []
+    cursor = 0
+    for start, end in merged:
+        pieces.append(data[cursor:start])
+        pieces.append(REDACTED)
+        cursor = end
+    pieces.append(data[cursor:])
+
+    return b''.join(pieces).decode('utf-8', errors='ignore'), len(merged)
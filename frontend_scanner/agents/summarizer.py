@@ -1,34 +1,102 @@
 """Summarizer Agent - Generate hierarchical summaries."""
-from typing import List, Dict, Any, Optional
+import asyncio
+import dataclasses
+import hashlib
+import json
+import re
+from typing import Iterable, List, Dict, Any, Optional
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
+from itertools import chain
 from pydantic import BaseModel, Field
 import os
 
-try:
-    from langchain_openai import ChatOpenAI
-    from langchain_core.prompts import ChatPromptTemplate
-    LLM_AVAILABLE = True
-except ImportError:
-    LLM_AVAILABLE = False
-    print("Warning: LangChain LLM not available")
+from frontend_scanner.utils.jit import maybe_njit, NUMBA_AVAILABLE
 
+# langchain imports happen lazily in __init__ so loading this module (and
+# CLI --help) never pays their startup cost.
 
-class FileSummary(BaseModel):
-    """Summary for a single file."""
+# Path component of an absolute URL, compiled once for the endpoint scan
+_URL_RE = re.compile(r'https?://[^/]+(/[^\s\'"]*)')
+
+
+@maybe_njit
+def _scan_url_paths(buf, offsets, out_start, out_len):
+    """Branch-light path extraction over a flat byte buffer (SoA layout).
+
+    For each string i spanning buf[offsets[i]:offsets[i+1]], finds the URL
+    path — the string itself when it starts with '/', otherwise the first
+    '/' after '://' — and cuts it at '?', whitespace, or quotes. Writes
+    (start, length) into the out arrays, start=-1 when no path. The loop
+    is nopython-safe so numba can JIT it when installed.
+    """
+    n = offsets.shape[0] - 1
+    for i in range(n):
+        s = offsets[i]
+        e = offsets[i + 1]
+        out_start[i] = -1
+        out_len[i] = 0
+        if s >= e:
+            continue
+
+        start = -1
+        if buf[s] == 47:  # '/'
+            start = s
+        else:
+            j = s
+            while j + 2 < e:
+                if buf[j] == 58 and buf[j + 1] == 47 and buf[j + 2] == 47:  # '://'
+                    k = j + 3
+                    while k < e and buf[k] != 47:
+                        k += 1
+                    if k < e:
+                        start = k
+                    break
+                j += 1
+
+        if start == -1:
+            continue
+
+        k = start
+        while k < e:
+            c = buf[k]
+            if c == 63 or c == 32 or c == 39 or c == 34 \
+                    or c == 9 or c == 10 or c == 13:  # ? space ' " \t \n \r
+                break
+            k += 1
+        out_start[i] = start
+        out_len[i] = k - start
+
+
+@dataclasses.dataclass(slots=True)
+class FileSummary:
+    """Summary for a single file.
+
+    Slotted dataclass: built once per file from trusted internal data, so
+    pydantic validation is pure overhead (see CodeChunk).
+    """
     file_path: str
     purpose: str
-    key_exports: List[str] = Field(default_factory=list)
-    api_dependencies: List[str] = Field(default_factory=list)
+    key_exports: List[str] = dataclasses.field(default_factory=list)
+    api_dependencies: List[str] = dataclasses.field(default_factory=list)
     framework: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for export."""
+        return dataclasses.asdict(self)
+
 
-class FolderSummary(BaseModel):
+@dataclasses.dataclass(slots=True)
+class FolderSummary:
     """Summary for a folder."""
     folder_path: str
     purpose: str
     file_count: int
-    key_files: List[str] = Field(default_factory=list)
+    key_files: List[str] = dataclasses.field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for export."""
+        return dataclasses.asdict(self)
 
 
 class ProjectSummary(BaseModel):
@@ -44,63 +112,300 @@ class ProjectSummary(BaseModel):
 class SummarizerAgent:
     """Agent that generates hierarchical summaries using LLM."""
     
+    SUMMARY_CACHE_NAME = "summary_cache.json"
+
     def __init__(self, config):
         self.config = config
         self.llm = None
-        
-        if LLM_AVAILABLE:
-            try:
-                api_key = os.getenv("OPENAI_API_KEY", "")
-                # Check if it's a valid API key (not placeholder)
-                if api_key and len(api_key) > 20 and not api_key.startswith("sk-your-"):
-                    self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-                    print("✓ Initialized LLM for summarization")
-                else:
-                    print("Warning: OPENAI_API_KEY not set or invalid. Summaries will be basic.")
-            except Exception as e:
-                print(f"Warning: Could not initialize LLM: {e}")
-                self.llm = None
+        self._summary_cache = self._load_summary_cache()
+        self._summary_cache_dirty = False
+
+        try:
+            from langchain_core.prompts import ChatPromptTemplate
+            self._prompt_cls = ChatPromptTemplate
+        except ImportError:
+            self._prompt_cls = None
+
+        # The templates are invariant — parse them once, not per call
+        self._file_prompt = None
+        self._batch_prompt = None
+        if self._prompt_cls is not None:
+            self._file_prompt = self._prompt_cls.from_messages([
+                ("system", "You are a code analyst. Summarize this file in one concise sentence (max 100 chars)."),
+                ("user", "File: {file_path}\n\nComponents: {components}\nExports: {exports}\nImports: {imports}\nAPI Calls: {api_calls}\n\nSummarize:")
+            ])
+            self._batch_prompt = self._prompt_cls.from_messages([
+                ("system",
+                 "You are a code analyst. Summarize each numbered file in one "
+                 "concise sentence (max 100 chars). Respond with ONLY a JSON "
+                 "array of strings, one per file, in input order."),
+                ("user", "{files}")
+            ])
+
+        try:
+            api_key = os.getenv("OPENAI_API_KEY", "")
+            # Check if it's a valid API key (not placeholder)
+            if api_key and len(api_key) > 20 and not api_key.startswith("sk-your-"):
+                from langchain_openai import ChatOpenAI
+                self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+                print("✓ Initialized LLM for summarization")
+            else:
+                print("Warning: OPENAI_API_KEY not set or invalid. Summaries will be basic.")
+        except ImportError:
+            print("Warning: LangChain LLM not available")
+        except Exception as e:
+            print(f"Warning: Could not initialize LLM: {e}")
+            self.llm = None
     
+    def _summary_cache_path(self) -> Path:
+        """Location of the persistent LLM-summary cache."""
+        return Path(self.config.output_dir) / self.SUMMARY_CACHE_NAME
+
+    def _load_summary_cache(self) -> Dict[str, str]:
+        """Load cached summaries from a previous scan."""
+        try:
+            with open(self._summary_cache_path(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Warning: Could not load summary cache: {e}")
+            return {}
+
+    def _save_summary_cache(self):
+        """Flush the summary cache to its sidecar file."""
+        if not self._summary_cache_dirty:
+            return
+        try:
+            path = self._summary_cache_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self._summary_cache, f)
+            self._summary_cache_dirty = False
+        except Exception as e:
+            print(f"Warning: Could not save summary cache: {e}")
+
+    @staticmethod
+    def _hash_parsed(parsed) -> str:
+        """Cache key over exactly the inputs the summary prompt sees.
+
+        Fields feed the hasher directly — the json.dumps(sort_keys=True)
+        detour was the hot cost of keying. One-byte field tags keep
+        adjacent fields from concatenating into colliding keys.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(parsed.file_path.encode('utf-8'))
+        for component in parsed.components[:3]:
+            h.update(b'\x00')
+            h.update(component.name.encode('utf-8'))
+        for export in parsed.exports[:3]:
+            h.update(b'\x01')
+            h.update(export.encode('utf-8'))
+        for imp in parsed.imports[:3]:
+            h.update(b'\x02')
+            h.update(imp.get("source", "").encode('utf-8'))
+        for call in parsed.api_calls[:2]:
+            h.update(b'\x03')
+            h.update(call.get("url", "").encode('utf-8'))
+        return h.hexdigest()
+
     def generate_summaries(self, parsed_files: List[Any], chunks: List[Any]) -> Dict[str, Any]:
         """Generate file, folder, and project summaries."""
         print("Generating summaries...")
-        
+
         file_summaries = self._generate_file_summaries(parsed_files)
-        folder_summaries = self._generate_folder_summaries(file_summaries)
+
+        # One fused pass accumulates the folder grouping and framework
+        # votes that the folder and project summaries both need, instead
+        # of each stage re-walking the summary list.
+        folder_files: Dict[str, List[FileSummary]] = {}
+        folder_frameworks: Dict[str, Counter] = {}
+        project_frameworks: Counter = Counter()
+
+        for summary in file_summaries:
+            folder = summary.file_path.rpartition('/')[0] or '.'
+            folder_files.setdefault(folder, []).append(summary)
+            if summary.framework:
+                folder_frameworks.setdefault(folder, Counter())[summary.framework] += 1
+                project_frameworks[summary.framework] += 1
+
+        folder_summaries = self._generate_folder_summaries(
+            folder_files, folder_frameworks
+        )
         project_summary = self._generate_project_summary(
             file_summaries,
-            folder_summaries,
+            project_frameworks,
             parsed_files
         )
-        
+
+        self._save_summary_cache()
+
         return {
             "file_summaries": file_summaries,
             "folder_summaries": folder_summaries,
             "project_summary": project_summary
         }
     
+    # How many LLM summary requests may be in flight at once
+    LLM_CONCURRENCY = 10
+    # Upper bound on files per request even when they fit the token budget
+    LLM_BATCH_SIZE = 20
+    # Greedy packing fills each request up to this many prompt tokens, so
+    # requests are neither underfull (wasted overhead) nor overlong
+    LLM_BATCH_TOKEN_BUDGET = 6000
+
+    @staticmethod
+    def _render_file_block(parsed) -> str:
+        """Render one file's prompt block (without its batch index)."""
+        return (
+            f"File: {Path(parsed.file_path).name}\n"
+            f"Components: {', '.join(c.name for c in parsed.components[:3]) or 'none'}\n"
+            f"Exports: {', '.join(parsed.exports[:3]) or 'none'}\n"
+            f"Imports: {', '.join(imp.get('source', '') for imp in parsed.imports[:3]) or 'none'}\n"
+            f"API Calls: {', '.join(call.get('url', '') for call in parsed.api_calls[:2]) or 'none'}"
+        )
+
+    def _count_prompt_tokens(self, text: str) -> int:
+        """Token count for batch packing (tiktoken, len//4 fallback)."""
+        if not hasattr(self, '_batch_encoder'):
+            try:
+                import tiktoken
+                self._batch_encoder = tiktoken.encoding_for_model("gpt-4o-mini")
+            except Exception:
+                self._batch_encoder = None
+
+        if self._batch_encoder is not None:
+            try:
+                return len(self._batch_encoder.encode(text))
+            except Exception:
+                pass
+        return len(text) >> 2
+
+    def _pack_batches(self, parsed_files: List[Any]) -> List[List[Any]]:
+        """Greedily pack files into batches under the token budget."""
+        batches = []
+        batch: List[Any] = []
+        total = 0
+
+        for parsed in parsed_files:
+            tokens = self._count_prompt_tokens(self._render_file_block(parsed))
+            if batch and (total + tokens > self.LLM_BATCH_TOKEN_BUDGET
+                          or len(batch) >= self.LLM_BATCH_SIZE):
+                batches.append(batch)
+                batch, total = [], 0
+            batch.append(parsed)
+            total += tokens
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _build_batch_messages(self, batch: List[Any]):
+        """Format one prompt covering a whole batch of files."""
+        blocks = [
+            f"[{i}] " + self._render_file_block(parsed)
+            for i, parsed in enumerate(batch)
+        ]
+        return self._batch_prompt.format_messages(files="\n\n".join(blocks))
+
+    @staticmethod
+    def _parse_batch_response(response, batch_size: int) -> List[Optional[str]]:
+        """Parse the JSON-array batch response, padding on shortfall."""
+        content = str(getattr(response, 'content', '') or '')
+        start, end = content.find('['), content.rfind(']')
+        if start == -1 or end <= start:
+            raise ValueError("no JSON array in batch response")
+
+        parsed = json.loads(content[start:end + 1])
+        if not isinstance(parsed, list):
+            raise ValueError("batch response is not a list")
+
+        summaries = [str(s)[:200] if s else None for s in parsed[:batch_size]]
+        summaries.extend([None] * (batch_size - len(summaries)))
+        return summaries
+
+    async def _gather_llm_summaries(self, parsed_files: List[Any]) -> Dict[int, str]:
+        """Run batched file-summary LLM calls concurrently.
+
+        Returns index -> summary for the files that succeeded; the rest
+        fall back to the basic summary.
+        """
+        batches = self._pack_batches(parsed_files)
+        message_lists = [self._build_batch_messages(batch) for batch in batches]
+
+        # LangChain Runnables dispatch abatch with native concurrency and
+        # rate-limit handling; fall back to a hand-rolled gather for LLM
+        # objects without it.
+        abatch = getattr(self.llm, "abatch", None)
+        if abatch is not None:
+            responses = await abatch(
+                message_lists,
+                config={"max_concurrency": self.LLM_CONCURRENCY},
+                return_exceptions=True
+            )
+        else:
+            semaphore = asyncio.Semaphore(self.LLM_CONCURRENCY)
+
+            async def call(messages):
+                async with semaphore:
+                    return await self.llm.ainvoke(messages)
+
+            responses = await asyncio.gather(
+                *(call(messages) for messages in message_lists),
+                return_exceptions=True
+            )
+
+        summaries = {}
+        offset = 0
+        for batch, response in zip(batches, responses):
+            if isinstance(response, Exception):
+                print(f"LLM batch summary failed for {len(batch)} files, using basic: {response}")
+            else:
+                try:
+                    for i, summary in enumerate(
+                            self._parse_batch_response(response, len(batch))):
+                        if summary:
+                            summaries[offset + i] = summary
+                except Exception as e:
+                    print(f"Could not parse batch summary response: {e}")
+            offset += len(batch)
+        return summaries
+
     def _generate_file_summaries(self, parsed_files: List[Any]) -> List[FileSummary]:
         """Generate summary for each file."""
         summaries = []
-        
-        for parsed in parsed_files:
-            if not parsed:
-                continue
-            
+        valid = [p for p in parsed_files if p and hasattr(p, 'file_path')]
+
+        # Cached summaries (keyed on the prompt inputs) skip the LLM
+        # entirely; only misses go over the network, concurrently.
+        llm_purposes: Dict[int, str] = {}
+        if self.llm and valid:
+            cache_keys = [self._hash_parsed(parsed) for parsed in valid]
+            misses = []
+            for i, key in enumerate(cache_keys):
+                cached = self._summary_cache.get(key)
+                if cached:
+                    llm_purposes[i] = cached
+                else:
+                    misses.append(i)
+
+            if misses:
+                try:
+                    fresh = asyncio.run(self._gather_llm_summaries(
+                        [valid[i] for i in misses]
+                    ))
+                    for j, summary in fresh.items():
+                        i = misses[j]
+                        llm_purposes[i] = summary
+                        self._summary_cache[cache_keys[i]] = summary
+                        self._summary_cache_dirty = True
+                except Exception as e:
+                    print(f"Concurrent LLM summarization failed, using basic summaries: {e}")
+
+        for i, parsed in enumerate(valid):
             try:
-                if not hasattr(parsed, 'file_path'):
-                    continue
-                
-                # Basic summary without LLM
-                purpose = self._generate_basic_summary(parsed)
-                
-                # Try LLM enhancement if available
-                if self.llm:
-                    try:
-                        purpose = self._generate_llm_summary(parsed)
-                    except Exception as e:
-                        print(f"LLM summary failed for {getattr(parsed, 'file_path', 'unknown')}, using basic: {e}")
-                
+                purpose = llm_purposes.get(i) or self._generate_basic_summary(parsed)
+
                 summaries.append(FileSummary(
                     file_path=parsed.file_path,
                     purpose=purpose,
@@ -140,47 +445,38 @@ class SummarizerAgent:
         
         return " | ".join(parts) if parts else "Code file"
     
+    def _build_summary_messages(self, parsed):
+        """Format the per-file summary prompt messages."""
+        return self._file_prompt.format_messages(
+            file_path=Path(parsed.file_path).name,
+            components=", ".join([c.name for c in parsed.components[:3]]) or "none",
+            exports=", ".join(parsed.exports[:3]) or "none",
+            imports=", ".join([imp.get("source", "") for imp in parsed.imports[:3]]) or "none",
+            api_calls=", ".join([call.get("url", "") for call in parsed.api_calls[:2]]) or "none"
+        )
+
     def _generate_llm_summary(self, parsed) -> str:
         """Generate summary using LLM."""
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a code analyst. Summarize this file in one concise sentence (max 100 chars)."),
-            ("user", "File: {file_path}\n\nComponents: {components}\nExports: {exports}\nImports: {imports}\nAPI Calls: {api_calls}\n\nSummarize:")
-        ])
-        
-        response = self.llm.invoke(
-            prompt.format_messages(
-                file_path=Path(parsed.file_path).name,
-                components=", ".join([c.name for c in parsed.components[:3]]) or "none",
-                exports=", ".join(parsed.exports[:3]) or "none",
-                imports=", ".join([imp.get("source", "") for imp in parsed.imports[:3]]) or "none",
-                api_calls=", ".join([call.get("url", "") for call in parsed.api_calls[:2]]) or "none"
-            )
-        )
-        
+        response = self.llm.invoke(self._build_summary_messages(parsed))
+
         if hasattr(response, 'content') and response.content:
             return str(response.content)[:200]
         return "No description available"
     
-    def _generate_folder_summaries(self, file_summaries: List[FileSummary]) -> List[FolderSummary]:
-        """Generate summary for each folder."""
-        folders = defaultdict(list)
-        
-        for summary in file_summaries:
-            folder = str(Path(summary.file_path).parent)
-            folders[folder].append(summary)
-        
+    def _generate_folder_summaries(self, folder_files: Dict[str, List[FileSummary]],
+                                   folder_frameworks: Dict[str, Counter]) -> List[FolderSummary]:
+        """Generate summary for each folder from the fused accumulators."""
         folder_summaries = []
-        
-        for folder_path, files in folders.items():
+
+        for folder_path, files in folder_files.items():
             purpose = f"Contains {len(files)} file(s)"
-            
+
             # Add framework info
-            frameworks = [f.framework for f in files if f.framework]
+            frameworks = folder_frameworks.get(folder_path)
             if frameworks:
-                common_framework = max(set(frameworks), key=frameworks.count)
-                purpose += f" | Framework: {common_framework}"
-            
-            key_files = [Path(f.file_path).name for f in files[:5]]
+                purpose += f" | Framework: {frameworks.most_common(1)[0][0]}"
+
+            key_files = [f.file_path.rpartition('/')[2] for f in files[:5]]
             
             folder_summaries.append(FolderSummary(
                 folder_path=folder_path,
@@ -193,17 +489,20 @@ class SummarizerAgent:
         return folder_summaries
     
     def _generate_project_summary(self, file_summaries: List[FileSummary],
-                                  folder_summaries: List[FolderSummary],
+                                  project_frameworks: Counter,
                                   parsed_files: List[Any]) -> ProjectSummary:
         """Generate project-level summary."""
-        frameworks = [f.framework for f in file_summaries if f.framework]
-        framework = max(set(frameworks), key=frameworks.count) if frameworks else None
-        
-        all_api_calls = []
-        for parsed in parsed_files:
-            if parsed and hasattr(parsed, 'api_calls'):
-                all_api_calls.extend([call.get("url", "") for call in (parsed.api_calls or [])])
+        framework = (project_frameworks.most_common(1)[0][0]
+                     if project_frameworks else None)
         
+        # Stream URLs straight into the endpoint extractor — no throwaway
+        # per-file lists
+        all_api_calls = chain.from_iterable(
+            (call.get("url", "") for call in (parsed.api_calls or []))
+            for parsed in parsed_files
+            if parsed and hasattr(parsed, 'api_calls')
+        )
+
         api_endpoints = self._extract_api_endpoints(all_api_calls)
         suggested = self._suggest_backend_endpoints(api_endpoints)
         
@@ -222,31 +521,61 @@ class SummarizerAgent:
             framework=framework,
             architecture=architecture,
             key_components=top_components,
-            api_endpoints_used=list(set(api_endpoints))[:10],
+            api_endpoints_used=list(dict.fromkeys(api_endpoints))[:10],
             suggested_backend_endpoints=suggested
         )
         
         print(f"✓ Generated project summary | Framework: {framework}")
         return summary
     
-    def _extract_api_endpoints(self, api_calls: List[str]) -> List[str]:
+    # Below this many call strings the regex loop beats buffer assembly
+    FLAT_URL_SCAN_THRESHOLD = 100_000
+
+    def _extract_api_endpoints_flat(self, calls: List[str]) -> List[str]:
+        """JIT'd flat-buffer variant of the endpoint scan for mega-repos."""
+        import numpy as np
+
+        encoded = [call.encode('utf-8', errors='ignore') if call else b''
+                   for call in calls]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+        out_start = np.empty(len(encoded), dtype=np.int64)
+        out_len = np.empty(len(encoded), dtype=np.int64)
+        _scan_url_paths(buf, offsets, out_start, out_len)
+
+        raw = buf.tobytes()
+        return [
+            raw[start:start + length].decode('utf-8', errors='ignore')
+            for start, length in zip(out_start, out_len)
+            if start >= 0
+        ]
+
+    def _extract_api_endpoints(self, api_calls: Iterable[str]) -> List[str]:
         """Extract API endpoints from fetch/axios calls."""
-        import re
+        calls = api_calls if isinstance(api_calls, list) else list(api_calls)
+
+        # Mega-repo volumes go through the JIT'd byte scanner when numba
+        # actually compiled it; otherwise the regex loop is faster.
+        if NUMBA_AVAILABLE and len(calls) >= self.FLAT_URL_SCAN_THRESHOLD:
+            return self._extract_api_endpoints_flat(calls)
+
         endpoints = []
-        
-        for call in api_calls:
+
+        for call in calls:
             if not call:
                 continue
-            
+
             # Extract path patterns
             if call.startswith('/'):
-                endpoints.append(call.split('?')[0])
+                endpoints.append(call.partition('?')[0])
             elif 'http' in call:
                 # Extract path from full URL
-                match = re.search(r'https?://[^/]+(/[^\s\'"]*)', call)
+                match = _URL_RE.search(call)
                 if match:
-                    endpoints.append(match.group(1).split('?')[0])
-        
+                    endpoints.append(match.group(1).partition('?')[0])
+
         return endpoints
     
     def _suggest_backend_endpoints(self, endpoints: List[str]) -> List[str]:
@@ -7,7 +7,6 @@ from rich.table import Table
 import sys
 
 from frontend_scanner.config import ScannerConfig
-from frontend_scanner.workflows.scanner_graph import create_scanner_workflow
 
 console = Console()
 
@@ -58,9 +57,11 @@ def main(path, out, config, incremental):
         console.print(table)
         console.print()
         
-        # Create and execute workflow
+        # Create and execute workflow (imported here so --help stays fast)
         console.print("[yellow]Starting scan...[/yellow]\n")
-        
+
+        from frontend_scanner.workflows.scanner_graph import create_scanner_workflow
+
         workflow = create_scanner_workflow(scanner_config)
         
         result = workflow.invoke({
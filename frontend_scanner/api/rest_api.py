@@ -1,14 +1,87 @@
 """REST API for Frontend Scanner."""
 from fastapi import FastAPI, HTTPException, Body
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 from pathlib import Path
 from typing import Optional, Dict, Any
+import asyncio
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
 
 from frontend_scanner.config import ScannerConfig
-from frontend_scanner.workflows.scanner_graph import create_scanner_workflow
-from frontend_scanner.storage.vector_store import VectorStoreFactory
+
+# The workflow graph and vector-store factory pull in langgraph/langchain
+# and the store backends; both import lazily inside their endpoints so the
+# API process starts fast.
+
+
+def _json_response(data) -> Response:
+    """Serialize a response with orjson when available (3-10x faster)."""
+    if ORJSON_AVAILABLE:
+        return Response(
+            content=orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY),
+            media_type="application/json"
+        )
+    return JSONResponse(data)
+
+
+def _load_json_file(path: Path):
+    """Parse a JSON artifact from disk with the fast decoder."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+async def _load_json_file_async(path: Path):
+    """Async variant of _load_json_file; the read yields to the loop."""
+    if AIOFILES_AVAILABLE:
+        async with aiofiles.open(path, 'rb') as f:
+            data = await f.read()
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    return _load_json_file(path)
+
+
+# file_path -> summary index per (output_dir, summaries mtime); the mtime
+# key invalidates entries automatically when a new scan rewrites the file.
+_summary_index_cache: Dict[tuple, Dict[str, dict]] = {}
+_SUMMARY_INDEX_CACHE_SIZE = 16
+
+
+async def _load_summary_index(output_dir: str, mtime_ns: int) -> Dict[str, dict]:
+    """Load (or reuse) the summary index for one scan output."""
+    key = (output_dir, mtime_ns)
+    index = _summary_index_cache.get(key)
+    if index is None:
+        summaries = await _load_json_file_async(
+            Path(output_dir) / "hierarchical_summaries.json"
+        )
+        index = {
+            s.get("file_path", ""): s
+            for s in summaries.get("file_summaries", [])
+        }
+        if len(_summary_index_cache) >= _SUMMARY_INDEX_CACHE_SIZE:
+            _summary_index_cache.clear()
+        _summary_index_cache[key] = index
+    return index
+
+
+# Scans run here so the event loop keeps servicing /manifest and /query
+# while a scan is in flight; module-level to avoid per-request pools.
+_SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=2,
+                                    thread_name_prefix="scanner")
 
 app = FastAPI(
     title="Frontend Scanner API",
@@ -68,9 +141,13 @@ async def scan_project(request: ScanRequest):
             output_dir=Path(request.output_dir)
         )
         
+        from frontend_scanner.workflows.scanner_graph import create_scanner_workflow
+
         workflow = create_scanner_workflow(config)
-        
-        result = workflow.invoke({
+
+        # The scan is long, blocking CPU+IO work; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(_SCAN_EXECUTOR, workflow.invoke, {
             "config": config,
             "file_inventory": None,
             "parsed_files": [],
@@ -81,10 +158,10 @@ async def scan_project(request: ScanRequest):
             "vector_index": None,
             "logs": []
         })
-        
+
         manifest = result.get("manifest")
-        
-        return JSONResponse({
+
+        return _json_response({
             "status": "success",
             "manifest": manifest.model_dump() if manifest else {},
             "logs": result.get("logs", [])
@@ -110,10 +187,7 @@ async def get_manifest(output_dir: str = "./scan-output"):
                 detail=f"Manifest not found at {manifest_path}"
             )
         
-        with open(manifest_path, 'r', encoding='utf-8') as f:
-            manifest = json.load(f)
-        
-        return JSONResponse(manifest)
+        return _json_response(await _load_json_file_async(manifest_path))
     
     except HTTPException:
         raise
@@ -131,7 +205,9 @@ async def semantic_query(request: QueryRequest):
             output_dir=Path("./scan-output")
         )
         
-        vector_store = VectorStoreFactory.create(config)
+        from frontend_scanner.storage.vector_store import VectorStoreFactory
+
+        vector_store = VectorStoreFactory.create(config, load_existing=True)
         
         # Get query embedding based on configured provider
         try:
@@ -158,7 +234,7 @@ async def semantic_query(request: QueryRequest):
             filters=request.filters
         )
         
-        return JSONResponse({
+        return _json_response({
             "query": request.query,
             "results": results
         })
@@ -178,16 +254,20 @@ async def get_file_ast(path: str, output_dir: str = "./scan-output"):
         if not summaries_path.exists():
             raise HTTPException(status_code=404, detail="Summaries not found")
         
-        with open(summaries_path, 'r', encoding='utf-8') as f:
-            summaries = json.load(f)
-        
-        # Find file summary
-        file_summaries = summaries.get("file_summaries", [])
-        
-        for file_summary in file_summaries:
-            if path in file_summary.get("file_path", ""):
-                return JSONResponse(file_summary)
-        
+        index = await _load_summary_index(output_dir,
+                                          os.stat(summaries_path).st_mtime_ns)
+
+        # Exact match first, then the original substring semantics
+        file_summary = index.get(path)
+        if file_summary is None:
+            for file_path, summary in index.items():
+                if path in file_path:
+                    file_summary = summary
+                    break
+
+        if file_summary is not None:
+            return _json_response(file_summary)
+
         raise HTTPException(status_code=404, detail=f"File '{path}' not found in summaries")
     
     except HTTPException:
@@ -198,4 +278,20 @@ async def get_file_ast(path: str, output_dir: str = "./scan-output"):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+
+    # Import-string form enables multi-worker pre-fork; uvloop/httptools
+    # give 2-4x async throughput over the default loop when installed.
+    uvicorn.run(
+        "frontend_scanner.api.rest_api:app",
+        host="0.0.0.0",
+        port=8000,
+        loop=loop_impl,
+        http="auto",
+        workers=os.cpu_count()
+    )
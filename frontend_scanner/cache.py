@@ -0,0 +1,93 @@
+"""Persistent hash-keyed cache for embeddings.
+
+Embeddings are deterministic functions of (content, model, dimensions),
+so a cache keyed on all three makes re-scans of an unchanged project cost
+near-zero provider traffic without ever serving vectors produced by a
+different model configuration. LLM summaries have their own sidecar cache
+in SummarizerAgent.
+"""
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+CACHE_DB_NAME = ".cache.sqlite"
+
+
+class ScanCache:
+    """SQLite-backed embedding cache keyed by blake2b content hashes."""
+
+    # SQLite's default parameter limit is 999; stay under it
+    _IN_CLAUSE_CHUNK = 500
+
+    def __init__(self, db_path):
+        self.db_path = str(db_path)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        """Create the embeddings table, dropping pre-model-key versions."""
+        columns = {
+            row[1] for row in
+            self.conn.execute("PRAGMA table_info(embeddings)")
+        }
+        if columns and not {"model", "dims"} <= columns:
+            # Old schema keyed on hash alone; entries are ambiguous across
+            # model configs, so start over (the cache is disposable)
+            self.conn.execute("DROP TABLE embeddings")
+
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                hash TEXT NOT NULL,
+                model TEXT NOT NULL,
+                dims INTEGER NOT NULL,
+                vec BLOB,
+                PRIMARY KEY (hash, model, dims)
+            )
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        """Stable 128-bit key for a piece of content."""
+        return hashlib.blake2b(
+            text.encode('utf-8', errors='ignore'), digest_size=16
+        ).hexdigest()
+
+    def get_embeddings(self, hashes: List[str], model: str,
+                       dims: int) -> Dict[str, np.ndarray]:
+        """Fetch cached vectors for one model config in chunked queries."""
+        found: Dict[str, np.ndarray] = {}
+        for i in range(0, len(hashes), self._IN_CLAUSE_CHUNK):
+            chunk = hashes[i:i + self._IN_CLAUSE_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT hash, vec FROM embeddings"
+                f" WHERE model = ? AND dims = ? AND hash IN ({placeholders})",
+                [model, dims, *chunk]
+            )
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_embeddings(self, items: Dict[str, np.ndarray], model: str,
+                       dims: int):
+        """Store vectors; one transaction regardless of count."""
+        if not items:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (hash, model, dims, vec)"
+                " VALUES (?, ?, ?, ?)",
+                ((key, model, dims,
+                  np.asarray(vec, dtype=np.float32).tobytes())
+                 for key, vec in items.items())
+            )
+
+    def close(self):
+        """Close the underlying connection."""
+        self.conn.close()
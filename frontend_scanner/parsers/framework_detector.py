@@ -1,70 +1,84 @@
 """Framework detection utilities."""
 import json
+import os
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Dict, Literal, Optional
 
 Framework = Literal["react", "nextjs", "vue", "svelte", "angular", "static"]
 
 
 class FrameworkDetector:
     """Detect frontend framework from project structure."""
-    
+
     @staticmethod
-    def detect(project_root: Path) -> Optional[Framework]:
-        """Detect framework from project structure and files."""
-        
+    def detect_all(project_root: Path) -> Dict[str, Optional[str]]:
+        """Detect framework and build tool in one directory pass.
+
+        One os.scandir of the project root replaces the dozen separate
+        Path.exists() stat calls the per-question API used to issue, and
+        package.json is parsed at most once.
+        """
+        names = set()
+        try:
+            with os.scandir(project_root) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            pass
+
+        framework: Optional[Framework] = None
+
         # Check package.json
-        package_json = project_root / "package.json"
-        if package_json.exists():
+        if "package.json" in names:
             try:
-                with open(package_json, 'r', encoding='utf-8') as f:
+                with open(project_root / "package.json", 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    deps = {
-                        **data.get("dependencies", {}),
-                        **data.get("devDependencies", {})
-                    }
-                    
-                    if "next" in deps:
-                        return "nextjs"
-                    elif "react" in deps:
-                        return "react"
-                    elif "vue" in deps:
-                        return "vue"
-                    elif "svelte" in deps:
-                        return "svelte"
-                    elif "@angular/core" in deps:
-                        return "angular"
+                deps = {
+                    **data.get("dependencies", {}),
+                    **data.get("devDependencies", {})
+                }
+
+                if "next" in deps:
+                    framework = "nextjs"
+                elif "react" in deps:
+                    framework = "react"
+                elif "vue" in deps:
+                    framework = "vue"
+                elif "svelte" in deps:
+                    framework = "svelte"
+                elif "@angular/core" in deps:
+                    framework = "angular"
             except Exception as e:
                 print(f"Error reading package.json: {e}")
-        
+
         # Check for specific config files
-        if (project_root / "next.config.js").exists() or \
-           (project_root / "next.config.mjs").exists() or \
-           (project_root / "next.config.ts").exists():
-            return "nextjs"
-        
-        if (project_root / "vue.config.js").exists():
-            return "vue"
-        
-        if (project_root / "svelte.config.js").exists():
-            return "svelte"
-        
-        if (project_root / "angular.json").exists():
-            return "angular"
-        
-        return "static"
-    
+        if framework is None:
+            if names & {"next.config.js", "next.config.mjs", "next.config.ts"}:
+                framework = "nextjs"
+            elif "vue.config.js" in names:
+                framework = "vue"
+            elif "svelte.config.js" in names:
+                framework = "svelte"
+            elif "angular.json" in names:
+                framework = "angular"
+            else:
+                framework = "static"
+
+        build_tool = None
+        if names & {"vite.config.js", "vite.config.ts"}:
+            build_tool = "vite"
+        elif "webpack.config.js" in names:
+            build_tool = "webpack"
+        elif "rollup.config.js" in names:
+            build_tool = "rollup"
+
+        return {"framework": framework, "build_tool": build_tool}
+
+    @staticmethod
+    def detect(project_root: Path) -> Optional[Framework]:
+        """Detect framework from project structure and files."""
+        return FrameworkDetector.detect_all(project_root)["framework"]
+
     @staticmethod
     def detect_build_tool(project_root: Path) -> Optional[str]:
         """Detect build tool (Vite, webpack, etc.)."""
-        if (project_root / "vite.config.js").exists() or \
-           (project_root / "vite.config.ts").exists():
-            return "vite"
-        
-        if (project_root / "webpack.config.js").exists():
-            return "webpack"
-        
-        if (project_root / "rollup.config.js").exists():
-            return "rollup"
-        
-        return None
+        return FrameworkDetector.detect_all(project_root)["build_tool"]
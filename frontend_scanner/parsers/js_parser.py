@@ -1,69 +1,91 @@
 """JavaScript/TypeScript parser utilities."""
+from bisect import bisect_right
 from typing import List, Dict, Any
-import re
+
+try:
+    # Linear-time DFA engine with a drop-in API; no backtracking blowups
+    import re2 as re  # type: ignore
+except ImportError:
+    import re
+
+# Compiled once at import; these run per file in hot scan loops
+_FUNC_RE = re.compile(r'function\s+(\w+)\s*\([^)]*\)\s*\{')
+_ARROW_RE = re.compile(r'const\s+(\w+)\s*=\s*\([^)]*\)\s*=>')
+_CLASS_RE = re.compile(r'class\s+(\w+)(?:\s+extends\s+(\w+))?\s*\{')
+_IMPORT_RE = re.compile(r'import\s+.*?\s+from\s+["\']([^"\']+)["\']')
+
+
+def _newline_offsets(code: str) -> List[int]:
+    """Offsets of every newline in one pass.
+
+    Each match's line number is then a bisect over this table rather than
+    an O(file) prefix slice-and-count per match.
+    """
+    offsets = []
+    idx = code.find('\n')
+    while idx != -1:
+        offsets.append(idx)
+        idx = code.find('\n', idx + 1)
+    return offsets
+
+
+def _line_of(offsets: List[int], pos: int) -> int:
+    """1-based line number of a character offset."""
+    return bisect_right(offsets, pos - 1) + 1
 
 
 class JSParser:
     """Advanced JavaScript/TypeScript parser utilities."""
-    
+
     @staticmethod
     def extract_functions(code: str) -> List[Dict[str, Any]]:
         """Extract function declarations using regex."""
         functions = []
-        
+        offsets = _newline_offsets(code)
+
         # Match function declarations
-        pattern = r'function\s+(\w+)\s*\([^)]*\)\s*\{'
-        matches = re.finditer(pattern, code)
-        
-        for match in matches:
+        for match in _FUNC_RE.finditer(code):
             functions.append({
                 "name": match.group(1),
-                "start_line": code[:match.start()].count('\n') + 1,
+                "start_line": _line_of(offsets, match.start()),
                 "type": "function"
             })
-        
+
         # Match arrow functions
-        pattern = r'const\s+(\w+)\s*=\s*\([^)]*\)\s*=>'
-        matches = re.finditer(pattern, code)
-        
-        for match in matches:
+        for match in _ARROW_RE.finditer(code):
             functions.append({
                 "name": match.group(1),
-                "start_line": code[:match.start()].count('\n') + 1,
+                "start_line": _line_of(offsets, match.start()),
                 "type": "arrow_function"
             })
-        
+
         return functions
-    
+
     @staticmethod
     def extract_classes(code: str) -> List[Dict[str, Any]]:
         """Extract class declarations."""
         classes = []
-        
-        pattern = r'class\s+(\w+)(?:\s+extends\s+(\w+))?\s*\{'
-        matches = re.finditer(pattern, code)
-        
-        for match in matches:
+        offsets = _newline_offsets(code)
+
+        for match in _CLASS_RE.finditer(code):
             classes.append({
                 "name": match.group(1),
                 "extends": match.group(2),
-                "start_line": code[:match.start()].count('\n') + 1
+                "start_line": _line_of(offsets, match.start())
             })
-        
+
         return classes
-    
+
     @staticmethod
     def extract_imports(code: str) -> List[Dict[str, Any]]:
         """Extract import statements."""
         imports = []
-        
-        pattern = r'import\s+.*?\s+from\s+["\']([^"\']+)["\']'
-        matches = re.finditer(pattern, code)
-        
-        for match in matches:
+        offsets = _newline_offsets(code)
+
+        for match in _IMPORT_RE.finditer(code):
             imports.append({
                 "source": match.group(1),
-                "line": code[:match.start()].count('\n') + 1
+                "line": _line_of(offsets, match.start())
             })
-        
+
         return imports
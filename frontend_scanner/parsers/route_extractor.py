@@ -1,7 +1,46 @@
 """Route extraction for different frameworks."""
+import os
 from pathlib import Path
-from typing import List
-import re
+from typing import Iterator, List
+
+try:
+    # Linear-time DFA engine with a drop-in API; no backtracking blowups
+    import re2 as re  # type: ignore
+except ImportError:
+    import re
+
+# Extensions that can define Next.js page routes
+_ROUTE_EXTS = (".js", ".jsx", ".ts", ".tsx")
+
+
+def _iter_source_files(root: str) -> Iterator[str]:
+    """Yield route-relevant file paths under root via os.scandir.
+
+    Path.rglob doesn't expand shell-style braces, so the old
+    rglob("*.{js,jsx,ts,tsx}") matched nothing; a scandir walk also skips
+    per-entry Path construction.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(_ROUTE_EXTS):
+                        yield entry.path
+        except OSError:
+            continue
+
+# Compiled once at import; these run per file in hot scan loops
+_REACT_ROUTE_RE = re.compile(r'<Route\s+path=["\'](.*?)["\']')
+_VUE_PATH_RE = re.compile(r'path:\s*["\']([^"\']+)["\']')
+# Route normalization: drop a trailing index *segment* plus extension in
+# one sub (anchored so names like reindex.js keep their name), then
+# rewrite [param] segments to :param
+_ROUTE_NORM_RE = re.compile(r'(?:(?:^|/)index)?\.(?:jsx?|tsx?)$')
+_BRACKET_RE = re.compile(r'\[([^\]]+)\]')
 
 
 class RouteExtractor:
@@ -14,30 +53,16 @@ class RouteExtractor:
         
         if not pages_dir.exists():
             return routes
-        
-        for file_path in pages_dir.rglob("*.{js,jsx,ts,tsx}"):
+
+        base = str(pages_dir)
+        for file_path in _iter_source_files(base):
             try:
-                # Convert file path to route
-                route = str(file_path.relative_to(pages_dir))
-                
-                # Remove file extension
-                route = route.rsplit('.', 1)[0]
-                
-                # Convert index to /
-                if route.endswith('/index') or route == 'index':
-                    route = route.replace('index', '')
-                
-                # Convert [param] to :param
-                route = route.replace('[', ':').replace(']', '')
-                
-                # Add leading slash
-                if not route.startswith('/'):
-                    route = '/' + route
-                
-                if not route:
-                    route = '/'
-                
-                routes.append(route)
+                # Convert file path to route: strip extension (+ trailing
+                # index) and rewrite [param] segments, two subs total
+                rel = file_path[len(base) + 1:]
+                route = _ROUTE_NORM_RE.sub('', rel)
+                route = _BRACKET_RE.sub(r':\1', route)
+                routes.append('/' + route.lstrip('/') if route else '/')
             except Exception:
                 continue
         
@@ -46,23 +71,11 @@ class RouteExtractor:
     @staticmethod
     def extract_react_router_routes(code: str) -> List[str]:
         """Extract routes from React Router configuration."""
-        routes = []
-        
         # Match <Route path="..." />
-        pattern = r'<Route\s+path=["\'](.*?)["\']'
-        matches = re.findall(pattern, code)
-        routes.extend(matches)
-        
-        return routes
-    
+        return _REACT_ROUTE_RE.findall(code)
+
     @staticmethod
     def extract_vue_routes(code: str) -> List[str]:
         """Extract routes from Vue Router configuration."""
-        routes = []
-        
         # Match path: '...'
-        pattern = r'path:\s*["\']([^"\']+)["\']'
-        matches = re.findall(pattern, code)
-        routes.extend(matches)
-        
-        return routes
+        return _VUE_PATH_RE.findall(code)
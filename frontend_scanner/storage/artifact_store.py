@@ -1,49 +1,106 @@
 """Artifact store for saving scan outputs."""
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    # Keep indent for human-readable artifacts; numpy arrays and non-str
+    # keys serialize without pre-conversion
+    _ORJSON_OPTS = (orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _encode_json(data: Any) -> bytes:
+    """Encode one value to JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY
+                            | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data).encode('utf-8')
+
+
+def _dump_json_streaming(path: Path, items: Iterable[Tuple[str, Any]]):
+    """Write a JSON object entry-by-entry.
+
+    Peak memory stays O(one entry) instead of O(whole artifact), which
+    matters for tens-of-MB summaries/inventories on large projects.
+    """
+    with open(path, 'wb') as f:
+        f.write(b'{\n')
+        first = True
+        for key, value in items:
+            if not first:
+                f.write(b',\n')
+            first = False
+            f.write(_encode_json(str(key)))
+            f.write(b': ')
+            f.write(_encode_json(value))
+        f.write(b'\n}\n')
+
+
+def _dump_json(path: Path, data: Dict[str, Any]):
+    """Write a JSON artifact with the fast encoder when available."""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=_ORJSON_OPTS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
 
 
 class ArtifactStore:
     """Store for scan artifacts (manifests, summaries, logs)."""
-    
+
     def __init__(self, output_dir: str):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-    
+
     def save_manifest(self, manifest: Dict[str, Any]) -> Path:
         """Save manifest.json."""
         path = self.output_dir / "manifest.json"
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2)
+        _dump_json(path, manifest)
         return path
-    
+
     def save_summaries(self, summaries: Dict[str, Any]) -> Path:
         """Save hierarchical_summaries.json."""
         path = self.output_dir / "hierarchical_summaries.json"
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(summaries, f, indent=2)
+        _dump_json(path, summaries)
         return path
-    
+
     def save_inventory(self, inventory: Dict[str, Any]) -> Path:
         """Save file_inventory.json."""
         path = self.output_dir / "file_inventory.json"
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(inventory, f, indent=2)
+        _dump_json(path, inventory)
         return path
-    
+
+    def save_summaries_streaming(self, items: Iterable[Tuple[str, Any]]) -> Path:
+        """Stream hierarchical_summaries.json from a (key, value) iterator."""
+        path = self.output_dir / "hierarchical_summaries.json"
+        _dump_json_streaming(path, items)
+        return path
+
+    def save_inventory_streaming(self, items: Iterable[Tuple[str, Any]]) -> Path:
+        """Stream file_inventory.json from a (key, value) iterator."""
+        path = self.output_dir / "file_inventory.json"
+        _dump_json_streaming(path, items)
+        return path
+
     def save_changeset(self, changeset: Dict[str, Any]) -> Path:
         """Save changeset.json (for incremental scans)."""
         path = self.output_dir / "changeset.json"
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(changeset, f, indent=2)
+        _dump_json(path, changeset)
         return path
-    
+
     def load_artifact(self, artifact_name: str) -> Dict[str, Any]:
         """Load an artifact by name."""
         path = self.output_dir / f"{artifact_name}.json"
         if not path.exists():
             return {}
-        
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
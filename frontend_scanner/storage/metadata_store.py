@@ -1,23 +1,56 @@
 """Metadata store using SQLite."""
 import sqlite3
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import json
 
+try:
+    import ormsgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 
 class MetadataStore:
     """SQLite-based metadata store for file inventory and scan history."""
     
     def __init__(self, db_path: str = "./metadata.db"):
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # One connection per thread: with WAL enabled, parallel writers
+        # (e.g. the threaded hashing ingest) coalesce through SQLite's WAL
+        # instead of serializing on a shared Python connection.
+        self._tls = threading.local()
         self._init_schema()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """This thread's connection, created (with pragmas) on first use."""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            # WAL + relaxed sync: group commits instead of one fsync per
+            # row; memory temp store and mmap'd pages keep lookups off
+            # the heap
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            self._tls.conn = conn
+        return conn
     
+    _INSERT_FILE_SQL = """
+        INSERT OR REPLACE INTO files
+        (path, relative_path, file_type, size_bytes, sha256_hash, last_modified, last_scanned, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def _init_schema(self):
         """Initialize database schema."""
         cursor = self.conn.cursor()
-        
+
         # Files table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS files (
@@ -29,10 +62,17 @@ class MetadataStore:
                 sha256_hash TEXT,
                 last_modified TEXT,
                 last_scanned TEXT,
-                metadata TEXT
+                metadata BLOB
             )
         """)
         
+        # Covering index: change detection reads (path, hash) without
+        # touching the row (no json metadata decode)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_files_path_hash
+            ON files(path, sha256_hash)
+        """)
+
         # Scans table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS scans (
@@ -47,15 +87,27 @@ class MetadataStore:
         
         self.conn.commit()
     
-    def store_file(self, file_path: str, metadata: Dict[str, Any]):
-        """Store or update file metadata."""
-        cursor = self.conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO files 
-            (path, relative_path, file_type, size_bytes, sha256_hash, last_modified, last_scanned, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    @staticmethod
+    def _pack_metadata(metadata: Dict[str, Any]):
+        """Serialize the metadata blob (msgpack when available)."""
+        if MSGPACK_AVAILABLE:
+            return ormsgpack.packb(metadata)
+        return json.dumps(metadata)
+
+    @staticmethod
+    def _unpack_metadata(raw) -> Dict[str, Any]:
+        """Deserialize the blob, accepting legacy JSON text rows."""
+        if not raw:
+            return {}
+        if isinstance(raw, (bytes, memoryview)):
+            if MSGPACK_AVAILABLE:
+                return ormsgpack.unpackb(bytes(raw))
+            return json.loads(bytes(raw))
+        return json.loads(raw)
+
+    def _file_record(self, file_path: str, metadata: Dict[str, Any]) -> Tuple:
+        """Build one row for the files table."""
+        return (
             file_path,
             metadata.get("relative_path"),
             metadata.get("file_type"),
@@ -63,10 +115,24 @@ class MetadataStore:
             metadata.get("sha256_hash"),
             metadata.get("last_modified"),
             datetime.now().isoformat(),
-            json.dumps(metadata)
-        ))
-        
+            self._pack_metadata(metadata)
+        )
+
+    def store_file(self, file_path: str, metadata: Dict[str, Any]):
+        """Store or update file metadata."""
+        cursor = self.conn.cursor()
+        cursor.execute(self._INSERT_FILE_SQL,
+                       self._file_record(file_path, metadata))
         self.conn.commit()
+
+    def store_files_bulk(self, records: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Store many files in one transaction (one fsync, not N)."""
+        with self.conn:
+            self.conn.executemany(
+                self._INSERT_FILE_SQL,
+                (self._file_record(path, metadata)
+                 for path, metadata in records)
+            )
     
     def get_file(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Retrieve file metadata."""
@@ -84,20 +150,35 @@ class MetadataStore:
                 "sha256_hash": row[5],
                 "last_modified": row[6],
                 "last_scanned": row[7],
-                "metadata": json.loads(row[8]) if row[8] else {}
+                "metadata": self._unpack_metadata(row[8])
             }
         return None
     
+    # SQLite's default parameter limit is 999; stay under it
+    _IN_CLAUSE_CHUNK = 500
+
     def get_changed_files(self, current_hashes: Dict[str, str]) -> List[str]:
-        """Get list of files that have changed since last scan."""
-        changed = []
-        
-        for path, new_hash in current_hashes.items():
-            stored = self.get_file(path)
-            if not stored or stored["sha256_hash"] != new_hash:
-                changed.append(path)
-        
-        return changed
+        """Get list of files that have changed since last scan.
+
+        One chunked index-only SELECT per 500 paths, instead of a full-row
+        point lookup (and metadata JSON decode) per file.
+        """
+        paths = list(current_hashes.keys())
+        stored: Dict[str, str] = {}
+
+        for i in range(0, len(paths), self._IN_CLAUSE_CHUNK):
+            chunk = paths[i:i + self._IN_CLAUSE_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT path, sha256_hash FROM files WHERE path IN ({placeholders})",
+                chunk
+            )
+            stored.update(rows)
+
+        return [
+            path for path, new_hash in current_hashes.items()
+            if stored.get(path) != new_hash
+        ]
     
     def record_scan(self, scan_data: Dict[str, Any]):
         """Record a scan session."""
@@ -115,5 +196,8 @@ class MetadataStore:
         self.conn.commit()
     
     def close(self):
-        """Close database connection."""
-        self.conn.close()
+        """Close the calling thread's database connection."""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._tls.conn = None
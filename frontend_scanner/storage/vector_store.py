@@ -20,25 +20,34 @@ except ImportError:
     FAISS_AVAILABLE = False
     print("Warning: FAISS not available")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class VectorStore(ABC):
     """Abstract vector store interface."""
-    
+
+    # Chunks buffered before one batched index insert
+    BATCH_SIZE = 512
+
     @abstractmethod
     def add(self, chunk_id: str, embedding: List[float],
             content: str, metadata: Dict[str, Any], provenance: Dict[str, Any]):
-        """Add a chunk with embedding."""
+        """Add a chunk with embedding (may be buffered until persist())."""
         pass
-    
+
     @abstractmethod
     def query(self, query_embedding: List[float], k: int = 5,
               filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Semantic search."""
         pass
-    
+
     @abstractmethod
     def persist(self):
-        """Persist to disk."""
+        """Flush buffered adds and persist to disk."""
         pass
 
 
@@ -68,14 +77,19 @@ class ChromaVectorStore(VectorStore):
         except Exception as e:
             print(f"Error creating Chroma collection: {e}")
             raise
+
+        self._buf_ids = []
+        self._buf_embeddings = []
+        self._buf_documents = []
+        self._buf_metadatas = []
     
     def add(self, chunk_id: str, embedding: List[float],
             content: str, metadata: Dict[str, Any], provenance: Dict[str, Any]):
-        """Add chunk to Chroma."""
+        """Buffer a chunk; batches amortize Chroma's HNSW insert cost."""
         try:
             # Combine metadata and provenance
             full_metadata = {**metadata, **provenance}
-            
+
             # Convert non-string values to strings for Chroma
             clean_metadata = {}
             for k, v in full_metadata.items():
@@ -90,20 +104,41 @@ class ChromaVectorStore(VectorStore):
                         clean_metadata[k] = str(v)
                 except Exception:
                     continue
-            
+
+            self._buf_ids.append(chunk_id)
+            self._buf_embeddings.append(embedding)
+            self._buf_documents.append(content)
+            self._buf_metadatas.append(clean_metadata)
+
+            if len(self._buf_ids) >= self.BATCH_SIZE:
+                self._flush()
+        except Exception as e:
+            print(f"Error adding to Chroma: {e}")
+
+    def _flush(self):
+        """Issue one batched collection.add for everything buffered."""
+        if not self._buf_ids:
+            return
+        try:
             self.collection.add(
-                ids=[chunk_id],
-                embeddings=[embedding],
-                documents=[content],
-                metadatas=[clean_metadata]
+                ids=self._buf_ids,
+                embeddings=self._buf_embeddings,
+                documents=self._buf_documents,
+                metadatas=self._buf_metadatas
             )
         except Exception as e:
-            print(f"Error adding to Chroma: {e}")
+            print(f"Error adding batch to Chroma: {e}")
+        finally:
+            self._buf_ids = []
+            self._buf_embeddings = []
+            self._buf_documents = []
+            self._buf_metadatas = []
     
     def query(self, query_embedding: List[float], k: int = 5,
               filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Query Chroma."""
         try:
+            self._flush()  # Queries must see everything buffered so far
             results = self.collection.query(
                 query_embeddings=[query_embedding],
                 n_results=k,
@@ -124,8 +159,8 @@ class ChromaVectorStore(VectorStore):
             return []
     
     def persist(self):
-        """Chroma auto-persists."""
-        pass
+        """Flush the insert buffer; Chroma persists on its own."""
+        self._flush()
 
 
 class FAISSVectorStore(VectorStore):
@@ -137,90 +172,218 @@ class FAISSVectorStore(VectorStore):
         
         self.config = config
         self.dimension = config.embedding.dimensions
-        self.index = faiss.IndexFlatL2(self.dimension)
+        # HNSW approximate-NN over normalized vectors: sub-millisecond
+        # queries at high recall instead of a brute-force O(N*D) scan, and
+        # inner product over unit vectors == cosine (matching Chroma).
+        # Scalar quantization trades precision for memory bandwidth — the
+        # search is bandwidth-bound, so int8 ~4x / fp16 ~2x over fp32.
+        quantize = getattr(config.embedding, 'quantize', 'fp16')
+        if quantize == "none":
+            self.index = faiss.IndexHNSWFlat(self.dimension, 32,
+                                             faiss.METRIC_INNER_PRODUCT)
+        else:
+            qtype = (faiss.ScalarQuantizer.QT_8bit if quantize == "int8"
+                     else faiss.ScalarQuantizer.QT_fp16)
+            self.index = faiss.IndexHNSWSQ(self.dimension, qtype, 32,
+                                           faiss.METRIC_INNER_PRODUCT)
+        self.index.hnsw.efConstruction = 200
+        self.index.hnsw.efSearch = 64
         self.chunk_data = []
-        
+        # Preallocated ingest buffer: add() writes rows in place instead
+        # of allocating a list wrap + dtype copy per chunk
+        self._emb_buf = np.empty((self.BATCH_SIZE, self.dimension),
+                                 dtype=np.float32)
+        self._buf_count = 0
+        self._buf_chunk_data = []
+        self._query_buf = np.empty((1, self.dimension), dtype=np.float32)
+        # Columnar (SoA) metadata aligned with chunk_data, so query-time
+        # filtering is a numpy mask instead of per-result dict probing
+        self._meta_columns: Dict[str, list] = {}
+
         print(f"✓ FAISS index initialized (dimension: {self.dimension})")
-    
+
+    def _append_meta_row(self, metadata: Dict[str, Any], row_index: int):
+        """Append one row to the metadata columns, keeping them aligned."""
+        for key, value in metadata.items():
+            column = self._meta_columns.get(key)
+            if column is None:
+                column = [None] * row_index
+                self._meta_columns[key] = column
+            column.append(value)
+
+        for column in self._meta_columns.values():
+            if len(column) == row_index:
+                column.append(None)
+
     def add(self, chunk_id: str, embedding: List[float],
             content: str, metadata: Dict[str, Any], provenance: Dict[str, Any]):
-        """Add to FAISS."""
+        """Buffer a vector; batches hit the FAISS FFI once per BATCH_SIZE."""
         try:
-            embedding_array = np.array([embedding]).astype('float32')
-            self.index.add(embedding_array)
-            
-            self.chunk_data.append({
+            np.copyto(self._emb_buf[self._buf_count], embedding)
+            self._buf_count += 1
+            self._buf_chunk_data.append({
                 "chunk_id": chunk_id,
                 "content": content,
                 "metadata": metadata,
                 "provenance": provenance
             })
+
+            if self._buf_count >= self.BATCH_SIZE:
+                self._flush()
         except Exception as e:
             print(f"Error adding to FAISS: {e}")
-    
+
+    def _flush(self):
+        """Insert all buffered vectors with one index.add call."""
+        if not self._buf_count:
+            return
+        try:
+            batch = self._emb_buf[:self._buf_count]
+            faiss.normalize_L2(batch)
+            if not self.index.is_trained:
+                # fp16 SQ training is a cheap range fit on the first batch
+                self.index.train(batch)
+            self.index.add(batch)
+            for data in self._buf_chunk_data:
+                self._append_meta_row(data.get("metadata") or {},
+                                      len(self.chunk_data))
+                self.chunk_data.append(data)
+        except Exception as e:
+            print(f"Error adding batch to FAISS: {e}")
+        finally:
+            self._buf_count = 0
+            self._buf_chunk_data = []
+
     def query(self, query_embedding: List[float], k: int = 5,
               filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Query FAISS."""
         try:
-            query_array = np.array([query_embedding]).astype('float32')
-            distances, indices = self.index.search(query_array, min(k, len(self.chunk_data)))
-            
-            results = []
-            for i, idx in enumerate(indices[0]):
-                if idx < len(self.chunk_data) and idx >= 0:
-                    result = {
-                        **self.chunk_data[idx],
-                        "distance": float(distances[0][i])
-                    }
-                    
-                    # Apply filters if provided
-                    if filters:
-                        match = True
-                        for key, value in filters.items():
-                            if result.get("metadata", {}).get(key) != value:
-                                match = False
-                                break
-                        if match:
-                            results.append(result)
-                    else:
-                        results.append(result)
-            
-            return results
+            self._flush()  # Queries must see everything buffered so far
+            np.copyto(self._query_buf[0], query_embedding)
+            faiss.normalize_L2(self._query_buf)
+            distances, indices = self.index.search(
+                self._query_buf, min(k, len(self.chunk_data))
+            )
+
+            pairs = [
+                (int(idx), float(dist))
+                for idx, dist in zip(indices[0], distances[0])
+                if 0 <= idx < len(self.chunk_data)
+            ]
+
+            # Filters evaluate as boolean masks over the metadata columns
+            if filters and pairs:
+                idx_array = np.fromiter((p[0] for p in pairs), dtype=np.int64,
+                                        count=len(pairs))
+                mask = np.ones(len(pairs), dtype=bool)
+                for key, value in filters.items():
+                    column = self._meta_columns.get(key)
+                    if column is None:
+                        mask[:] = False
+                        break
+                    mask &= np.asarray(column, dtype=object)[idx_array] == value
+                pairs = [pair for pair, keep in zip(pairs, mask) if keep]
+
+            return [
+                {**self.chunk_data[idx], "distance": dist}
+                for idx, dist in pairs
+            ]
         except Exception as e:
             print(f"Error querying FAISS: {e}")
             return []
     
     def persist(self):
-        """Save FAISS index."""
+        """Save FAISS index and columnar metadata."""
         from pathlib import Path
-        
+
+        self._flush()
+
         try:
             persist_dir = Path(self.config.vector_store.persist_directory)
             persist_dir.mkdir(parents=True, exist_ok=True)
-            
+
             # Save index
             faiss.write_index(self.index, str(persist_dir / "index.faiss"))
-            
-            # Save metadata
-            with open(persist_dir / "metadata.pkl", 'wb') as f:
-                pickle.dump(self.chunk_data, f)
-            
+
+            # Metadata goes out as JSON with the columnar (SoA) layout
+            # preserved, replacing the old pickle blob
+            doc = {
+                "chunk_data": self.chunk_data,
+                "meta_columns": self._meta_columns,
+            }
+            if ORJSON_AVAILABLE:
+                with open(persist_dir / "metadata.json", 'wb') as f:
+                    f.write(orjson.dumps(doc))
+            else:
+                import json
+                with open(persist_dir / "metadata.json", 'w', encoding='utf-8') as f:
+                    json.dump(doc, f)
+
             print(f"✓ FAISS index persisted to {persist_dir}")
         except Exception as e:
             print(f"Error persisting FAISS: {e}")
 
+    def load(self) -> bool:
+        """Load a persisted index (memory-mapped) and its metadata."""
+        from pathlib import Path
+
+        persist_dir = Path(self.config.vector_store.persist_directory)
+        index_path = persist_dir / "index.faiss"
+        if not index_path.exists():
+            return False
+
+        try:
+            # mmap keeps the vector pages on disk until a search touches
+            # them, so load time and resident memory stay near zero
+            try:
+                self.index = faiss.read_index(str(index_path),
+                                              faiss.IO_FLAG_MMAP)
+            except Exception:
+                self.index = faiss.read_index(str(index_path))
+
+            metadata_path = persist_dir / "metadata.json"
+            legacy_path = persist_dir / "metadata.pkl"
+            if metadata_path.exists():
+                with open(metadata_path, 'rb') as f:
+                    data = f.read()
+                if ORJSON_AVAILABLE:
+                    doc = orjson.loads(data)
+                else:
+                    import json
+                    doc = json.loads(data)
+                self.chunk_data = doc.get("chunk_data", [])
+                self._meta_columns = doc.get("meta_columns", {})
+            elif legacy_path.exists():
+                with open(legacy_path, 'rb') as f:
+                    self.chunk_data = pickle.load(f)
+                self._meta_columns = {}
+
+            return True
+        except Exception as e:
+            print(f"Error loading FAISS index: {e}")
+            return False
+
 
 class VectorStoreFactory:
     """Factory for creating vector stores."""
-    
+
     @staticmethod
-    def create(config) -> VectorStore:
-        """Create vector store based on config."""
+    def create(config, load_existing: bool = False) -> VectorStore:
+        """Create vector store based on config.
+
+        ``load_existing`` restores a previously persisted index (used by
+        query paths); index-building paths keep a fresh store so a new
+        scan doesn't stack on top of the last one. Chroma's persistent
+        client reopens its collection either way.
+        """
         backend = config.vector_store.backend
-        
+
         if backend == "chroma":
             return ChromaVectorStore(config)
         elif backend == "faiss":
-            return FAISSVectorStore(config)
+            store = FAISSVectorStore(config)
+            if load_existing:
+                store.load()
+            return store
         else:
             raise ValueError(f"Unknown vector store backend: {backend}")
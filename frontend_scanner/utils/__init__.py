@@ -1,13 +1,15 @@
 """Utility modules."""
-from frontend_scanner.utils.hashing import compute_file_hash, compute_content_hash
-from frontend_scanner.utils.chunking import token_based_chunking, count_tokens
+from frontend_scanner.utils.hashing import compute_file_hash, compute_content_hash, hash_many
+from frontend_scanner.utils.chunking import token_based_chunking, count_tokens, count_tokens_many
 from frontend_scanner.utils.security import redact_secrets, is_sensitive_file
 
 __all__ = [
     "compute_file_hash",
     "compute_content_hash",
+    "hash_many",
     "token_based_chunking",
     "count_tokens",
+    "count_tokens_many",
     "redact_secrets",
     "is_sensitive_file"
 ]
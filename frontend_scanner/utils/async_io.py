@@ -0,0 +1,49 @@
+"""Batched asynchronous file reading."""
+import asyncio
+from typing import Dict, List
+
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+# Reads submitted concurrently per wave; enough to keep the queue deep
+# without exhausting file descriptors
+READ_BATCH_SIZE = 64
+
+
+def read_many(paths: List[str], batch_size: int = READ_BATCH_SIZE) -> Dict[str, bytes]:
+    """Read many files with batches of reads in flight at once.
+
+    Keeps dozens of opens/reads submitted concurrently so per-file
+    syscall latency overlaps — the asyncio analogue of io_uring batching
+    for small-file-heavy trees. Returns path -> bytes for the files that
+    could be read; unreadable files are simply absent. Returns {} when
+    aiofiles is unavailable, letting callers fall back to blocking reads.
+    """
+    if not AIOFILES_AVAILABLE or not paths:
+        return {}
+
+    async def _read(path: str):
+        try:
+            async with aiofiles.open(path, 'rb') as f:
+                return path, await f.read()
+        except OSError:
+            return path, None
+
+    async def _read_all():
+        out: Dict[str, bytes] = {}
+        for i in range(0, len(paths), batch_size):
+            wave = await asyncio.gather(
+                *(_read(path) for path in paths[i:i + batch_size])
+            )
+            for path, data in wave:
+                if data is not None:
+                    out[path] = data
+        return out
+
+    try:
+        return asyncio.run(_read_all())
+    except Exception:
+        return {}
@@ -1,5 +1,6 @@
 """Chunking utility functions."""
-from typing import Iterator
+import os
+from typing import Iterator, List
 
 try:
     import tiktoken
@@ -7,14 +8,26 @@ try:
 except ImportError:
     TIKTOKEN_AVAILABLE = False
 
+# Lazily-built module singleton: get_encoding re-parses the BPE merge
+# table on every call, which dominates small-file processing
+_ENCODING = None
+
+
+def _get_encoding():
+    """Return the shared cl100k_base encoding, building it once."""
+    global _ENCODING
+    if _ENCODING is None:
+        _ENCODING = tiktoken.get_encoding("cl100k_base")
+    return _ENCODING
+
 
 def token_based_chunking(text: str, chunk_size: int = 1000,
                         overlap: int = 200) -> Iterator[str]:
     """Split text into chunks based on token count."""
     if TIKTOKEN_AVAILABLE:
-        encoding = tiktoken.get_encoding("cl100k_base")
+        encoding = _get_encoding()
         tokens = encoding.encode(text)
-        
+
         for i in range(0, len(tokens), chunk_size - overlap):
             chunk_tokens = tokens[i:i + chunk_size]
             chunk_text = encoding.decode(chunk_tokens)
@@ -28,8 +41,21 @@ def token_based_chunking(text: str, chunk_size: int = 1000,
 def count_tokens(text: str) -> int:
     """Count tokens in text."""
     if TIKTOKEN_AVAILABLE:
-        encoding = tiktoken.get_encoding("cl100k_base")
-        return len(encoding.encode(text))
+        return len(_get_encoding().encode(text))
     else:
         # Approximate: 1 token ≈ 4 characters
         return len(text) // 4
+
+
+def count_tokens_many(texts: List[str]) -> List[int]:
+    """Count tokens for many texts in one batched call.
+
+    tiktoken's Rust backend releases the GIL and encodes the batch across
+    threads, so this scales with cores where per-text count_tokens can't.
+    """
+    if TIKTOKEN_AVAILABLE:
+        encoded = _get_encoding().encode_ordinary_batch(
+            texts, num_threads=os.cpu_count() or 1
+        )
+        return [len(tokens) for tokens in encoded]
+    return [len(text) // 4 for text in texts]
@@ -0,0 +1,20 @@
+"""Optional numba JIT support.
+
+numba is not a declared dependency; hot integer loops are written
+nopython-safe and pass through maybe_njit so they compile when numba is
+installed and run as plain Python otherwise.
+"""
+
+try:
+    from numba import njit as _njit  # type: ignore
+    NUMBA_AVAILABLE = True
+except ImportError:
+    _njit = None
+    NUMBA_AVAILABLE = False
+
+
+def maybe_njit(func):
+    """JIT-compile func with numba when available, else return it as-is."""
+    if NUMBA_AVAILABLE:
+        return _njit(cache=True)(func)
+    return func
@@ -1,6 +1,6 @@
 """Security and sanitization utilities."""
 import re
-from typing import List
+from typing import List, Optional
 
 DEFAULT_SECRET_PATTERNS = [
     r'(?i)(api[_-]?key|secret|password|token)\s*[:=]\s*["\']?[\w\-]+["\']?',
@@ -11,34 +11,66 @@ DEFAULT_SECRET_PATTERNS = [
     r'AIza[0-9A-Za-z\-_]{35}',  # Google API keys
 ]
 
+def _combine_patterns(patterns: List[str]) -> re.Pattern:
+    """Fuse patterns into one alternation for a single-scan substitution.
+
+    Leading (?i) flags are rewritten into scoped groups so the union
+    compiles on Python 3.11+.
+    """
+    return re.compile('|'.join(
+        '(?i:' + p[4:] + ')' if p.startswith('(?i)') else '(?:' + p + ')'
+        for p in patterns
+    ))
+
+
+# The default union compiles once at import: one linear scan replaces a
+# full sub() pass per pattern
+_DEFAULT_SECRET_RE = _combine_patterns(DEFAULT_SECRET_PATTERNS)
+
 
 def redact_secrets(text: str, patterns: Optional[List[str]] = None) -> str:
     """Redact secrets from text."""
     if patterns is None:
-        patterns = DEFAULT_SECRET_PATTERNS
-    
-    redacted = text
-    for pattern_str in patterns:
-        try:
-            pattern = re.compile(pattern_str)
-            redacted = pattern.sub('[REDACTED]', redacted)
-        except Exception as e:
-            print(f"Error applying redaction pattern: {e}")
-            continue
-    
-    return redacted
+        return _DEFAULT_SECRET_RE.sub('[REDACTED]', text)
+
+    try:
+        combined = _combine_patterns(patterns)
+    except re.error as e:
+        print(f"Error applying redaction pattern: {e}")
+        return text
+
+    return combined.sub('[REDACTED]', text)
+
+
+SENSITIVE_FILE_PATTERNS = [
+    '.env',
+    'secret',
+    'credentials',
+    'config.json',
+    'auth',
+    'private',
+    '.pem',
+    '.key'
+]
+
+# One-pass multi-pattern matching: an Aho-Corasick automaton when the
+# optional binding is installed, otherwise a combined literal alternation
+# (sre builds its own prefix-dispatch table) instead of P substring scans.
+try:
+    import ahocorasick
+    _SENSITIVE_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in SENSITIVE_FILE_PATTERNS:
+        _SENSITIVE_AUTOMATON.add_word(_pattern, _pattern)
+    _SENSITIVE_AUTOMATON.make_automaton()
+except ImportError:
+    _SENSITIVE_AUTOMATON = None
+
+_SENSITIVE_RE = re.compile('|'.join(re.escape(p) for p in SENSITIVE_FILE_PATTERNS))
 
 
 def is_sensitive_file(file_path: str) -> bool:
     """Check if file might contain sensitive data."""
-    sensitive_patterns = [
-        '.env',
-        'secret',
-        'credentials',
-        'config.json',
-        'auth',
-        'private',
-        '.pem',
-        '.key'
-    ]
-    return any(pattern in file_path.lower() for pattern in sensitive_patterns)
+    lowered = file_path.lower()
+    if _SENSITIVE_AUTOMATON is not None:
+        return next(_SENSITIVE_AUTOMATON.iter(lowered), None) is not None
+    return _SENSITIVE_RE.search(lowered) is not None
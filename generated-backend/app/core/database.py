@@ -1,14 +1,42 @@
 """Database configuration."""
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for request handlers: a sync engine under async endpoints
+# blocks the event loop for every query, serializing the worker. Only
+# built when the URL actually maps to the asyncpg driver — a sqlite or
+# other sync URL keeps working exactly as before.
+ASYNC_DATABASE_URL = settings.DATABASE_URL.replace(
+    "postgresql://", "postgresql+asyncpg://"
+)
+
+async_engine = None
+AsyncSessionLocal = None
+
+if ASYNC_DATABASE_URL.startswith("postgresql+asyncpg://"):
+    try:
+        async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            pool_size=20,
+            max_overflow=40,
+            pool_pre_ping=True,
+        )
+        AsyncSessionLocal = async_sessionmaker(async_engine,
+                                               expire_on_commit=False)
+    except Exception:
+        # asyncpg missing or the dialect rejected the URL; handlers fall
+        # back to the sync session
+        async_engine = None
+        AsyncSessionLocal = None
+
 Base = declarative_base()
 
 
@@ -19,3 +47,14 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Async database dependency."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError(
+            "Async database support requires a postgresql:// DATABASE_URL "
+            "and the asyncpg driver (pip install asyncpg)"
+        )
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -1,33 +1,52 @@
 """Main FastAPI application."""
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
+try:
+    # orjson serializes responses ~5x faster than stdlib json
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
+
 from app.api import api_router
 from app.core.config import settings
 from app.core.database import engine, Base
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create dev-time tables off the event loop; production uses Alembic."""
+    if settings.ENVIRONMENT != "production":
+        await asyncio.to_thread(Base.metadata.create_all, bind=engine)
+    yield
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version="1.0.0",
-    description="Auto-generated backend API"
+    description="Auto-generated backend API",
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
 )
 
 # CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure in production
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Compression
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Compression: higher floor so small JSON bodies skip gzip entirely, and
+# level 1 trades ~10% size for ~3x less CPU per byte
+app.add_middleware(GZipMiddleware, minimum_size=4096, compresslevel=1)
 
 # Include API router
 app.include_router(api_router)
@@ -0,0 +1,17 @@
+"""Shared test configuration and import-sanity guards."""
+import sys
+from pathlib import Path
+
+import frontend_scanner.api.rest_api  # noqa: F401
+
+# Guard against a stale or shadowing copy of the REST module sneaking onto
+# sys.path (e.g. from the backend generator's identically named module).
+_EXPECTED_REST_API = (
+    Path(__file__).resolve().parent.parent
+    / "frontend_scanner" / "api" / "rest_api.py"
+)
+assert Path(sys.modules["frontend_scanner.api.rest_api"].__file__).resolve() \
+    == _EXPECTED_REST_API, (
+        "frontend_scanner.api.rest_api resolved to an unexpected file: "
+        f"{sys.modules['frontend_scanner.api.rest_api'].__file__}"
+    )